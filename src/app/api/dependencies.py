@@ -1,29 +1,119 @@
+import hashlib
+import ipaddress
+import math
+import time
+from contextlib import AbstractAsyncContextManager
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import CommaSeparatedStrings
 
-from app.core.db.database import async_get_db
+from app.core.cache import RecentKeys, principal_cache
+from app.core.config import settings
+from app.core.db.database import async_get_db, local_session, read_session
+from app.core.logger import logging
+from app.core.rate_limit import login_rate_limiters
 from app.core.security import verify_token
 from app.crud.users import get_user_by_id
-from app.models.user import User
+from app.schemas.auth import EmailRequest
+from app.schemas.user import UserInDB
+
+logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Clients that issued a write within their read-your-writes window
+_recent_writers = RecentKeys(
+    max_size=settings.DATABASE_READ_YOUR_WRITES_MAX_CLIENTS, ttl=settings.DATABASE_READ_YOUR_WRITES_SECONDS
+)
+
+
+_trusted_proxies = [
+    ipaddress.ip_network(proxy, strict=False) for proxy in CommaSeparatedStrings(settings.TRUSTED_PROXIES)
+]
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _trusted_proxies)
+
+
+def client_ip(request: Request) -> str:
+    """Get the client's address, looking through X-Forwarded-For added by trusted proxies.
+
+    The header is only believed when the direct peer is in `TRUSTED_PROXIES`. Entries are
+    read from the right, and the first one that is not a trusted proxy is the client;
+    anything to its left was supplied by the client and could be forged.
+    """
+    host = request.client.host if request.client else ""
+    if not _is_trusted_proxy(host):
+        return host
+
+    forwarded = ",".join(request.headers.getlist("x-forwarded-for")).split(",")
+    for entry in reversed(forwarded):
+        entry = entry.strip()
+        if not entry:
+            continue
+        host = entry
+        if not _is_trusted_proxy(host):
+            break
+    return host
+
+
+def _client_key(request: Request) -> str:
+    """Identify the client by its credentials, or its address and user agent when anonymous.
+
+    Only a digest is kept, so credentials are never held beyond the request.
+    """
+    identity = request.headers.get("authorization")
+    if not identity:
+        identity = f"{client_ip(request)} {request.headers.get('user-agent', '')}"
+    return hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+
+
+async def get_db(request: Request):
+    is_write = request.method not in SAFE_METHODS and settings.DATABASE_READ_YOUR_WRITES_SECONDS > 0
+    if is_write:
+        _recent_writers.add(_client_key(request))
 
-async def get_db():
     async for session in async_get_db():
         yield session
 
+    if is_write:
+        _recent_writers.add(_client_key(request))
+
+
+def open_read_session(request: Request) -> AbstractAsyncContextManager[AsyncSession]:
+    """Open a session for a read-only request.
+
+    Reads go to the replica unless the same client wrote within the last
+    `DATABASE_READ_YOUR_WRITES_SECONDS`, in which case they stay on the primary.
+    """
+    if _client_key(request) in _recent_writers:
+        return local_session()
+    return read_session()
+
+
+async def get_read_db(request: Request):
+    async with open_read_session(request) as session:
+        yield session
+
 
 DatabaseDep = Annotated[AsyncSession, Depends(get_db)]
+ReadDatabaseDep = Annotated[AsyncSession, Depends(get_read_db)]
 
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: DatabaseDep,
-) -> User:
+) -> UserInDB:
     token = credentials.credentials
     payload = verify_token(token)
 
@@ -42,6 +132,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    principal = principal_cache.get(int(user_id), token)
+    if principal:
+        return principal
+
     user = await get_user_by_id(db, int(user_id))
     if not user:
         raise HTTPException(
@@ -50,20 +144,47 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user
+    principal = UserInDB.model_validate(user)
+    principal_cache.set(user.id, token, principal)
+    return principal
 
 
-async def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]) -> User:
+async def get_current_active_user(current_user: Annotated[UserInDB, Depends(get_current_user)]) -> UserInDB:
     if current_user.is_deleted:
         raise HTTPException(status_code=400, detail="Deleted user")
     return current_user
 
 
-async def get_current_superuser(current_user: Annotated[User, Depends(get_current_active_user)]) -> User:
+async def get_current_superuser(current_user: Annotated[UserInDB, Depends(get_current_active_user)]) -> UserInDB:
     if not current_user.is_superuser:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
     return current_user
 
 
-CurrentUserDep = Annotated[User, Depends(get_current_active_user)]
-SuperUserDep = Annotated[User, Depends(get_current_superuser)]
+CurrentUserDep = Annotated[UserInDB, Depends(get_current_active_user)]
+SuperUserDep = Annotated[UserInDB, Depends(get_current_superuser)]
+
+
+async def limit_login_requests(request: Request, email_request: EmailRequest) -> None:
+    """Reject login requests over the per-email, per-IP or global limit with 429.
+
+    Runs before any database work. A request only uses up allowance when it is let through.
+    """
+    keys = {
+        "email": email_request.email.strip().lower(),
+        "ip": client_ip(request),
+        "global": "",
+    }
+    now = time.monotonic()
+    for scope, limiter in login_rate_limiters.items():
+        retry_after = limiter.retry_after(keys[scope], now)
+        if retry_after > 0:
+            logger.warning(f"Login request rate limited by {scope} limit")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login requests, please try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    for scope, limiter in login_rate_limiters.items():
+        limiter.consume(keys[scope], now)
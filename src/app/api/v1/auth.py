@@ -1,9 +1,9 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 
-from app.api.dependencies import CurrentUserDep, DatabaseDep
+from app.api.dependencies import CurrentUserDep, DatabaseDep, limit_login_requests
 from app.core.config import settings
-from app.core.email import send_magic_link_email, send_welcome_email
+from app.core.email_dispatcher import email_dispatcher
 from app.core.logger import logging
 from app.core.security import create_access_token
 from app.crud.auth import (
@@ -12,7 +12,9 @@ from app.crud.auth import (
     get_auth_token_by_token,
     mark_token_as_used,
 )
-from app.crud.users import create_user, get_user_by_email, get_user_by_id, get_user_by_username
+from app.crud.email_outbox import enqueue_email
+from app.crud.users import create_user_with_available_username, get_user_by_email, get_user_by_id
+from app.models.email_outbox import EmailKind
 from app.schemas.auth import EmailRequest, Token, VerifyCodeRequest
 from app.schemas.user import UserCreate, UserResponse
 
@@ -21,7 +23,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 logger = logging.getLogger(__name__)
 
 
-@router.post("/request-login", status_code=204)
+@router.post("/request-login", status_code=204, dependencies=[Depends(limit_login_requests)])
 async def request_login(
     request: Request,
     email_request: EmailRequest,
@@ -33,23 +35,18 @@ async def request_login(
     if not user:
         # Create new user with minimal info
         username = email.split("@")[0]
-        # Ensure username is unique
         base_username = username[:20]  # Max 20 chars
-        final_username = base_username
-        counter = 1
-        while await get_user_by_username(db, final_username):
-            final_username = f"{base_username}{counter}"
-            counter += 1
 
         user_create = UserCreate(
             email=email,
             name=base_username,
-            username=final_username,
+            username=base_username,
         )
-        user = await create_user(db, user_create)
+        # Ensure username is unique
+        user = await create_user_with_available_username(db, user_create)
 
-        # Send welcome email
-        await send_welcome_email(user.email, user.name)
+        # Queue welcome email
+        await enqueue_email(db, EmailKind.WELCOME, user.email, {"email": user.email, "name": user.name})
         logger.info(f"New user created: {user.email}")
 
     # Create auth token
@@ -66,13 +63,17 @@ async def request_login(
     # Generate magic link
     magic_link = f"{settings.BASE_URL}/auth/verify?token={auth_token.token}"
 
-    # Send email
-    await send_magic_link_email(
-        email=user.email,
-        name=user.name,
-        magic_link=magic_link,
-        otp_code=auth_token.code,
+    # Queue email for the dispatcher
+    await enqueue_email(
+        db,
+        EmailKind.MAGIC_LINK,
+        user.email,
+        {"email": user.email, "name": user.name, "magic_link": magic_link, "otp_code": auth_token.code},
     )
+    # The new user, the token and their emails are committed together, so none of them
+    # exists without the others
+    await db.commit()
+    email_dispatcher.notify()
 
 
 @router.post("/verify-code", response_model=Token)
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Body, HTTPException, Path, Query
+from fastapi import APIRouter, Body, Header, HTTPException, Path, Query, Response
 
-from app.api.dependencies import DatabaseDep
+from app.api.dependencies import DatabaseDep, ReadDatabaseDep
+from app.core.etag import etag_matches
 from app.crud import quadrants as quadrant_crud
 from app.crud import tasks as task_crud
-from app.schemas.quadrant import Quadrant, QuadrantBase, QuadrantCreate
+from app.schemas.quadrant import Quadrant, QuadrantBase, QuadrantCreate, QuadrantSummary
 from app.schemas.task import Task
 
 router = APIRouter(
@@ -15,21 +16,31 @@ router = APIRouter(
 
 @router.get("/", response_model=list[Quadrant])
 async def read_quadrants(
-    db: DatabaseDep,
     include_default: bool = Query(True, description="Include default quadrants"),
+    if_none_match: str | None = Header(None),
 ):
     """Get all quadrants."""
-    quadrants = await quadrant_crud.get_quadrants(db, include_default=include_default)
-    return quadrants
+    etag = await quadrant_crud.get_quadrants_etag(include_default=include_default)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    content = await quadrant_crud.get_quadrants_json(include_default=include_default)
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/summary", response_model=list[QuadrantSummary])
+async def read_quadrant_summaries(db: ReadDatabaseDep):
+    """Get total, open, completed and overdue task counts for every quadrant."""
+    return await quadrant_crud.get_quadrant_summaries(db)
 
 
 @router.get("/{quadrant_id}", response_model=Quadrant)
 async def read_quadrant(
-    db: DatabaseDep,
+    db: ReadDatabaseDep,
     quadrant_id: int = Path(..., description="The ID of the quadrant to retrieve"),
 ):
     """Get a specific quadrant by ID."""
-    quadrant = await quadrant_crud.get_quadrant_by_id(db, quadrant_id)
+    quadrant = await quadrant_crud.get_cached_quadrant(db, quadrant_id)
     if not quadrant:
         raise HTTPException(status_code=404, detail="Quadrant not found")
     return quadrant
@@ -83,8 +94,7 @@ async def update_task_quadrant(
 ):
     """Move a task to a different quadrant."""
     # Validate quadrant exists
-    quadrant = await quadrant_crud.get_quadrant_by_id(db, quadrant_id)
-    if not quadrant:
+    if not await quadrant_crud.quadrant_exists(db, quadrant_id):
         raise HTTPException(status_code=400, detail="Invalid quadrant ID")
 
     task = await task_crud.update_task_quadrant(db, task_id, quadrant_id)
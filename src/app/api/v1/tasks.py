@@ -1,9 +1,42 @@
-from fastapi import APIRouter, HTTPException, Path, Query
+import asyncio
+import csv
+import io
+import json
+from datetime import UTC, datetime
+from typing import Literal
 
-from app.api.dependencies import DatabaseDep
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import DatabaseDep, ReadDatabaseDep, open_read_session
+from app.core.config import settings
+from app.core.etag import etag_matches, make_etag
+from app.core.pagination import sync_watermark
+from app.core.responses import ClosingStreamingResponse, ModelJSONResponse
+from app.core.task_events import event_matches_quadrant, task_event_broker
+from app.core.task_import import ImportFormat, import_tasks
 from app.crud import quadrants as quadrant_crud
 from app.crud import tasks as task_crud
-from app.schemas.task import Task, TaskCreate, TaskUpdate
+from app.schemas.task import (
+    Task,
+    TaskBatchComplete,
+    TaskBatchCreate,
+    TaskBatchIds,
+    TaskBatchItemResult,
+    TaskBatchMove,
+    TaskBatchResult,
+    TaskCreate,
+    TaskImportResult,
+    TaskPage,
+    TaskSearchPage,
+    TaskSyncPage,
+    TaskUpdate,
+    task_adapter,
+    task_page_adapter,
+    task_search_page_adapter,
+    task_sync_page_adapter,
+)
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"], responses={404: {"description": "Not found"}})
 
@@ -12,39 +45,275 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"], responses={404: {"descriptio
 async def create_task(db: DatabaseDep, task: TaskCreate):
     """Create a new task."""
     # Validate quadrant_id exists
-    quadrant = await quadrant_crud.get_quadrant_by_id(db, int(task.quadrant_id))
-    if not quadrant:
+    if not await quadrant_crud.quadrant_exists(db, int(task.quadrant_id)):
         raise HTTPException(status_code=400, detail="Invalid quadrant ID")
 
     return await task_crud.create_task(db, task)
 
 
-@router.get("/", response_model=list[Task])
+@router.get("/", response_model=TaskPage | TaskSyncPage)
 async def read_tasks(
-    db: DatabaseDep,
+    request: Request,
+    db: ReadDatabaseDep,
     quadrant_id: int | None = Query(None, description="Filter by quadrant ID"),
     completed: bool | None = Query(None, description="Filter by completion status"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of tasks to return"),
+    cursor: str | None = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    updated_since: datetime | None = Query(
+        None, description="Only return changes after this watermark from a previous sync, including deletions"
+    ),
+    if_none_match: str | None = Header(None),
 ):
-    """Get all tasks with optional filtering."""
+    """Get a page of tasks with optional filtering.
+
+    With `updated_since`, returns only tasks changed after that watermark and the IDs of
+    tasks deleted since, oldest change first. Page through with `next_cursor`, then pass
+    the last page's `watermark` as `updated_since` on the next sync.
+    """
+    if updated_since is not None:
+        if quadrant_id or completed is not None:
+            raise HTTPException(status_code=400, detail="updated_since cannot be combined with filters")
+        return await _read_task_changes(db, updated_since, limit, cursor)
+
     # Validate quadrant_id if provided
     if quadrant_id:
-        quadrant = await quadrant_crud.get_quadrant_by_id(db, quadrant_id)
-        if not quadrant:
+        if not await quadrant_crud.quadrant_exists(db, quadrant_id):
             raise HTTPException(status_code=400, detail="Invalid quadrant ID")
 
-    return await task_crud.get_tasks(db, quadrant_id=quadrant_id, completed=completed)
+    # Answer unchanged polls before loading any rows
+    version = await task_crud.get_tasks_version(db)
+    etag = make_etag(request.url.query, version)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    try:
+        tasks, next_cursor = await task_crud.get_tasks_page(
+            db, limit=limit, cursor=cursor, quadrant_id=quadrant_id, completed=completed
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ModelJSONResponse(
+        {"items": tasks, "next_cursor": next_cursor}, adapter=task_page_adapter, headers={"ETag": etag}
+    )
+
+
+async def _read_task_changes(
+    db: AsyncSession, updated_since: datetime, limit: int, cursor: str | None
+) -> ModelJSONResponse:
+    if updated_since.tzinfo is None:
+        updated_since = updated_since.replace(tzinfo=UTC)
+    watermark = sync_watermark(updated_since, datetime.now(UTC), settings.DATABASE_SYNC_WATERMARK_LAG_SECONDS)
+
+    try:
+        tasks, next_cursor = await task_crud.get_task_changes(db, updated_since, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return ModelJSONResponse(
+        {
+            "items": [task for task in tasks if not task.is_deleted],
+            "deleted_ids": [task.id for task in tasks if task.is_deleted],
+            "next_cursor": next_cursor,
+            "watermark": watermark,
+        },
+        adapter=task_sync_page_adapter,
+    )
+
+
+@router.get("/search", response_model=TaskSearchPage)
+async def search_tasks(
+    db: ReadDatabaseDep,
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms; supports quotes, OR and -"),
+    quadrant_id: int | None = Query(None, description="Filter by quadrant ID"),
+    completed: bool | None = Query(None, description="Filter by completion status"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of tasks to return"),
+    offset: int = Query(0, ge=0, le=1000, description="Number of results to skip"),
+):
+    """Search task titles and descriptions, ranked by relevance."""
+    # Validate quadrant_id if provided
+    if quadrant_id:
+        if not await quadrant_crud.quadrant_exists(db, quadrant_id):
+            raise HTTPException(status_code=400, detail="Invalid quadrant ID")
+
+    tasks, next_offset = await task_crud.search_tasks(
+        db, q, limit=limit, offset=offset, quadrant_id=quadrant_id, completed=completed
+    )
+    return ModelJSONResponse({"items": tasks, "next_offset": next_offset}, adapter=task_search_page_adapter)
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_CSV_FIELDS = list(Task.model_fields)
+
+
+def _export_ndjson(tasks: list) -> bytes:
+    return b"".join(
+        task_adapter.dump_json(task_adapter.validate_python(task, from_attributes=True)) + b"\n" for task in tasks
+    )
+
+
+def _export_csv(tasks: list, header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS)
+    if header:
+        writer.writeheader()
+    writer.writerows(
+        task_adapter.dump_python(task_adapter.validate_python(task, from_attributes=True), mode="json")
+        for task in tasks
+    )
+    return buffer.getvalue()
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    request: Request,
+    db: ReadDatabaseDep,
+    quadrant_id: int | None = Query(None, description="Filter by quadrant ID"),
+    completed: bool | None = Query(None, description="Filter by completion status"),
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Export format"),
+):
+    """Export every task matching the filters as NDJSON or CSV, streamed as rows are read."""
+    # Validate quadrant_id if provided
+    if quadrant_id:
+        if not await quadrant_crud.quadrant_exists(db, quadrant_id):
+            raise HTTPException(status_code=400, detail="Invalid quadrant ID")
+
+    async def export_rows():
+        # The request's session is closed before the body is sent, so the stream opens its own
+        async with open_read_session(request) as session:
+            if export_format == "csv":
+                yield _export_csv([], header=True)
+            async for tasks in task_crud.stream_tasks(session, quadrant_id=quadrant_id, completed=completed):
+                yield _export_csv(tasks) if export_format == "csv" else _export_ndjson(tasks)
+
+    return ClosingStreamingResponse(
+        export_rows(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'},
+    )
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_task_events(
+    quadrant_id: int | None = Query(None, description="Only send events for tasks in or moved out of this quadrant"),
+):
+    """Stream task creates, updates, moves, completions and deletes as Server-Sent Events.
+
+    Moves carry `previous_quadrant_id`. An `imported` or `resync` event means many tasks
+    changed at once, or events may have been missed, and the client should reload.
+    """
+    if not task_event_broker.running:
+        raise HTTPException(status_code=503, detail="Task events are not available")
+
+    async def event_stream():
+        async with task_event_broker.subscribe() as queue:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=settings.TASK_EVENTS_HEARTBEAT_SECONDS)
+                except TimeoutError:
+                    # Comment lines keep proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    return
+                if not event_matches_quadrant(event, quadrant_id):
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+    return ClosingStreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/import", response_model=TaskImportResult)
+async def import_tasks_file(
+    request: Request,
+    db: DatabaseDep,
+    import_format: ImportFormat = Query(..., alias="format", description="Format of the request body"),
+):
+    """Bulk import tasks from a CSV or NDJSON request body, reporting rows that could not be imported."""
+    try:
+        content = (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be UTF-8 encoded")
+
+    return await import_tasks(db, content, import_format)
+
+
+def _batch_update_result(task_ids: list[int], tasks: list) -> TaskBatchResult:
+    tasks_by_id = {task.id: task for task in tasks}
+    return TaskBatchResult(
+        results=[
+            TaskBatchItemResult(id=task_id, success=True, task=tasks_by_id[task_id])
+            if task_id in tasks_by_id
+            else TaskBatchItemResult(id=task_id, success=False, detail="Task not found")
+            for task_id in task_ids
+        ]
+    )
+
+
+@router.post("/batch", response_model=TaskBatchResult)
+async def create_tasks(db: DatabaseDep, batch: TaskBatchCreate):
+    """Create several tasks at once."""
+    quadrant_ids = {int(task.quadrant_id) for task in batch.tasks}
+    valid_quadrant_ids = await quadrant_crud.get_existing_quadrant_ids(db, quadrant_ids)
+    valid_tasks = [task for task in batch.tasks if int(task.quadrant_id) in valid_quadrant_ids]
+    created = iter(await task_crud.create_tasks(db, valid_tasks) if valid_tasks else [])
+
+    results = []
+    for task in batch.tasks:
+        if int(task.quadrant_id) in valid_quadrant_ids:
+            db_task = next(created)
+            results.append(TaskBatchItemResult(id=db_task.id, success=True, task=db_task))
+        else:
+            results.append(TaskBatchItemResult(success=False, detail="Invalid quadrant ID"))
+    return TaskBatchResult(results=results)
+
+
+@router.patch("/batch/quadrant", response_model=TaskBatchResult)
+async def update_tasks_quadrant(db: DatabaseDep, batch: TaskBatchMove):
+    """Move several tasks to a different quadrant."""
+    if not await quadrant_crud.quadrant_exists(db, batch.quadrant_id):
+        raise HTTPException(status_code=400, detail="Invalid quadrant ID")
+
+    tasks = await task_crud.update_tasks_quadrant(db, batch.task_ids, batch.quadrant_id)
+    return _batch_update_result(batch.task_ids, tasks)
+
+
+@router.patch("/batch/complete", response_model=TaskBatchResult)
+async def set_tasks_completion(db: DatabaseDep, batch: TaskBatchComplete):
+    """Mark several tasks as complete or incomplete."""
+    tasks = await task_crud.set_tasks_completion(db, batch.task_ids, batch.completed)
+    return _batch_update_result(batch.task_ids, tasks)
+
+
+@router.post("/batch/delete", response_model=TaskBatchResult)
+async def delete_tasks(db: DatabaseDep, batch: TaskBatchIds):
+    """Delete several tasks."""
+    deleted_ids = set(await task_crud.delete_tasks(db, batch.task_ids))
+    return TaskBatchResult(
+        results=[
+            TaskBatchItemResult(id=task_id, success=True)
+            if task_id in deleted_ids
+            else TaskBatchItemResult(id=task_id, success=False, detail="Task not found")
+            for task_id in batch.task_ids
+        ]
+    )
 
 
 @router.get("/{task_id}", response_model=Task)
 async def read_task(
-    db: DatabaseDep,
+    db: ReadDatabaseDep,
     task_id: int = Path(..., description="The ID of the task to retrieve"),
 ):
     """Get a specific task by ID."""
     task = await task_crud.get_task_by_id(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return ModelJSONResponse(task, adapter=task_adapter)
 
 
 @router.put("/{task_id}", response_model=Task)
@@ -56,8 +325,7 @@ async def update_task(
     """Update a task's details."""
     # Validate quadrant_id if it's being updated
     if task_update.quadrant_id:
-        quadrant = await quadrant_crud.get_quadrant_by_id(db, int(task_update.quadrant_id))
-        if not quadrant:
+        if not await quadrant_crud.quadrant_exists(db, int(task_update.quadrant_id)):
             raise HTTPException(status_code=400, detail="Invalid quadrant ID")
 
     task = await task_crud.update_task(db, task_id, task_update)
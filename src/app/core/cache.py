@@ -0,0 +1,114 @@
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.schemas.user import UserInDB
+
+
+class PrincipalCache:
+    """Bounded LRU cache of authenticated users, keyed by (user id, token).
+
+    Entries expire after `ttl` seconds so changes made by other worker processes are
+    picked up eventually; writes in this process should call `invalidate_user`.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[int, str], tuple[float, UserInDB]] = OrderedDict()
+        self._keys_by_user: dict[int, set[tuple[int, str]]] = {}
+
+    def get(self, user_id: int, token: str) -> UserInDB | None:
+        key = (user_id, token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user_id: int, token: str, principal: UserInDB) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = (user_id, token)
+        self._entries[key] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(key)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: tuple[int, str]) -> None:
+        self._entries.pop(key, None)
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+
+principal_cache = PrincipalCache(max_size=settings.PRINCIPAL_CACHE_MAX_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+class RecentKeys:
+    """Bounded set of keys remembered for `ttl` seconds after they were last added.
+
+    Keys are kept in the order they were last added, which is also the order they
+    expire in, so expired keys are dropped from the front whenever the set is used.
+    At most `max_size` keys are kept, forgetting the oldest first.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._expires_at: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, key: str) -> None:
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        now = time.monotonic()
+        self._expires_at[key] = now + self.ttl
+        self._expires_at.move_to_end(key)
+        self._evict(now)
+
+    def __contains__(self, key: str) -> bool:
+        now = time.monotonic()
+        self._evict(now)
+        return key in self._expires_at
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def _evict(self, now: float) -> None:
+        while self._expires_at:
+            key, expires_at = next(iter(self._expires_at.items()))
+            if expires_at > now and len(self._expires_at) <= self.max_size:
+                break
+            del self._expires_at[key]
@@ -19,7 +19,20 @@ class AppSettings(BaseSettings):
 
 
 class DatabaseSettings(BaseSettings):
-    pass
+    DATABASE_POOL_SIZE: int = config("DATABASE_POOL_SIZE", default=5)
+    DATABASE_MAX_OVERFLOW: int = config("DATABASE_MAX_OVERFLOW", default=10)
+    DATABASE_POOL_TIMEOUT: float = config("DATABASE_POOL_TIMEOUT", default=30.0)
+    DATABASE_POOL_RECYCLE: int = config("DATABASE_POOL_RECYCLE", default=-1)
+    DATABASE_POOL_PRE_PING: bool = config("DATABASE_POOL_PRE_PING", default=False)
+    DATABASE_STATEMENT_CACHE_SIZE: int = config("DATABASE_STATEMENT_CACHE_SIZE", default=100)
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = config("DATABASE_READ_YOUR_WRITES_SECONDS", default=5.0)
+    DATABASE_READ_YOUR_WRITES_MAX_CLIENTS: int = config("DATABASE_READ_YOUR_WRITES_MAX_CLIENTS", default=10000)
+    DATABASE_REPLICA_RETRY_SECONDS: float = config("DATABASE_REPLICA_RETRY_SECONDS", default=30.0)
+    DATABASE_QUERY_BUDGET: int = config("DATABASE_QUERY_BUDGET", default=10)
+    DATABASE_REPEATED_QUERY_THRESHOLD: int = config("DATABASE_REPEATED_QUERY_THRESHOLD", default=3)
+    DATABASE_POOL_PREFILL: int = config("DATABASE_POOL_PREFILL", default=5)
+    DATABASE_WARMUP_RETRY_SECONDS: float = config("DATABASE_WARMUP_RETRY_SECONDS", default=5.0)
+    DATABASE_SYNC_WATERMARK_LAG_SECONDS: float = config("DATABASE_SYNC_WATERMARK_LAG_SECONDS", default=30.0)
 
 
 class PostgresSettings(DatabaseSettings):
@@ -32,6 +45,8 @@ class PostgresSettings(DatabaseSettings):
     POSTGRES_ASYNC_PREFIX: str = config("POSTGRES_ASYNC_PREFIX", default="postgresql+asyncpg://")
     POSTGRES_URI: str = f"{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
     POSTGRES_URL: str | None = config("POSTGRES_URL", default=None)
+    POSTGRES_REPLICA_SERVER: str | None = config("POSTGRES_REPLICA_SERVER", default=None)
+    POSTGRES_REPLICA_PORT: int = config("POSTGRES_REPLICA_PORT", default=5432)
 
 
 class EnvironmentOption(Enum):
@@ -53,6 +68,12 @@ class EmailSettings(BaseSettings):
     EMAIL_FROM_NAME: str = config("EMAIL_FROM_NAME", default="Dothe2")
     EMAIL_USE_TLS: bool = config("EMAIL_USE_TLS", default=True)
     EMAIL_USE_SSL: bool = config("EMAIL_USE_SSL", default=False)
+    EMAIL_OUTBOX_CONCURRENCY: int = config("EMAIL_OUTBOX_CONCURRENCY", default=4)
+    EMAIL_OUTBOX_BATCH_SIZE: int = config("EMAIL_OUTBOX_BATCH_SIZE", default=20)
+    EMAIL_OUTBOX_POLL_SECONDS: float = config("EMAIL_OUTBOX_POLL_SECONDS", default=5.0)
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = config("EMAIL_OUTBOX_MAX_ATTEMPTS", default=5)
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = config("EMAIL_OUTBOX_RETRY_BASE_SECONDS", default=30)
+    EMAIL_OUTBOX_LEASE_SECONDS: int = config("EMAIL_OUTBOX_LEASE_SECONDS", default=300)
 
 
 class AuthSettings(BaseSettings):
@@ -61,6 +82,34 @@ class AuthSettings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = config("ACCESS_TOKEN_EXPIRE_MINUTES", default=60 * 24 * 7)  # 7 days
     MAGIC_LINK_EXPIRE_MINUTES: int = config("MAGIC_LINK_EXPIRE_MINUTES", default=15)
     BASE_URL: str = config("BASE_URL", default="http://localhost:8000")
+    TOKEN_REAPER_INTERVAL_SECONDS: int = config("TOKEN_REAPER_INTERVAL_SECONDS", default=600)
+    TOKEN_REAPER_BATCH_SIZE: int = config("TOKEN_REAPER_BATCH_SIZE", default=1000)
+    TOKEN_REAPER_MAX_BATCHES: int = config("TOKEN_REAPER_MAX_BATCHES", default=100)
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: float = config("LOGIN_RATE_LIMIT_WINDOW_SECONDS", default=60.0)
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = config("LOGIN_RATE_LIMIT_PER_EMAIL", default=3)
+    LOGIN_RATE_LIMIT_PER_IP: int = config("LOGIN_RATE_LIMIT_PER_IP", default=20)
+    LOGIN_RATE_LIMIT_GLOBAL: int = config("LOGIN_RATE_LIMIT_GLOBAL", default=600)
+    # Comma-separated addresses or networks of reverse proxies whose X-Forwarded-For is believed
+    TRUSTED_PROXIES: str = config("TRUSTED_PROXIES", default="")
+
+
+class CacheSettings(BaseSettings):
+    QUADRANT_CACHE_TTL_SECONDS: int = config("QUADRANT_CACHE_TTL_SECONDS", default=60)
+    PRINCIPAL_CACHE_MAX_SIZE: int = config("PRINCIPAL_CACHE_MAX_SIZE", default=10000)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = config("PRINCIPAL_CACHE_TTL_SECONDS", default=60)
+
+
+class TaskEventSettings(BaseSettings):
+    # Starts the listener and the events endpoint; the task triggers notify either way
+    TASK_EVENTS_ENABLED: bool = config("TASK_EVENTS_ENABLED", default=True)
+    TASK_EVENTS_QUEUE_SIZE: int = config("TASK_EVENTS_QUEUE_SIZE", default=1000)
+    TASK_EVENTS_RETRY_SECONDS: float = config("TASK_EVENTS_RETRY_SECONDS", default=5.0)
+    TASK_EVENTS_HEARTBEAT_SECONDS: float = config("TASK_EVENTS_HEARTBEAT_SECONDS", default=15.0)
+
+
+class MetricsSettings(BaseSettings):
+    METRICS_ENABLED: bool = config("METRICS_ENABLED", default=False)
+    METRICS_PATH: str = config("METRICS_PATH", default="/metrics")
 
 
 class Settings(
@@ -69,6 +118,9 @@ class Settings(
     EnvironmentSettings,
     EmailSettings,
     AuthSettings,
+    CacheSettings,
+    MetricsSettings,
+    TaskEventSettings,
 ):
     pass
 
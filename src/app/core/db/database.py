@@ -1,8 +1,17 @@
-from sqlalchemy.ext.asyncio import create_async_engine
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.core.config import settings
+from app.core.db.pool import InstrumentedAsyncQueuePool
+from app.core.logger import logging
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -13,12 +22,70 @@ DATABASE_URI = settings.POSTGRES_URI
 DATABASE_PREFIX = settings.POSTGRES_ASYNC_PREFIX
 DATABASE_URL = f"{DATABASE_PREFIX}{DATABASE_URI}"
 
-async_engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+
+def create_pooled_engine(url: str) -> AsyncEngine:
+    """Create an async engine whose pool is sized and tuned from `DatabaseSettings`."""
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args={"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE},
+    )
+
+
+async_engine = create_pooled_engine(DATABASE_URL)
 
 local_session = sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
 
+replica_engine: AsyncEngine | None = None
+replica_session: sessionmaker | None = None
+if settings.POSTGRES_REPLICA_SERVER:
+    REPLICA_URI = (
+        f"{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
+        f"@{settings.POSTGRES_REPLICA_SERVER}:{settings.POSTGRES_REPLICA_PORT}/{settings.POSTGRES_DB}"
+    )
+    replica_engine = create_pooled_engine(f"{DATABASE_PREFIX}{REPLICA_URI}")
+    replica_session = sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False)
+
+_replica_unavailable_until = 0.0
+
 
 async def async_get_db() -> AsyncSession:
     async_session = local_session
     async with async_session() as db:
         yield db
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """Open a session on the read replica.
+
+    Falls back to the primary when no replica is configured or it cannot be reached;
+    an unreachable replica is skipped for `DATABASE_REPLICA_RETRY_SECONDS`.
+    """
+    global _replica_unavailable_until
+
+    if replica_session is not None and time.monotonic() >= _replica_unavailable_until:
+        async with replica_session() as db:
+            try:
+                await db.connection()
+            except (OSError, SQLAlchemyError) as e:
+                logger.warning(f"Read replica unavailable, falling back to primary: {str(e)}")
+                _replica_unavailable_until = time.monotonic() + settings.DATABASE_REPLICA_RETRY_SECONDS
+            else:
+                yield db
+                return
+
+    async with local_session() as db:
+        yield db
+
+
+async def async_get_read_db() -> AsyncSession:
+    async with read_session() as db:
+        yield db
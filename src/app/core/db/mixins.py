@@ -14,12 +14,20 @@ class UUIDMixin:
     )
 
 
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now(UTC), server_default=text("current_timestamp(0)")
+        DateTime(timezone=True), default=_utcnow, server_default=text("current_timestamp(0)")
     )
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True, onupdate=datetime.now(UTC), server_default=text("current_timestamp(0)")
+        DateTime(timezone=True),
+        nullable=True,
+        default=_utcnow,
+        onupdate=_utcnow,
+        server_default=text("current_timestamp(0)"),
     )
 
 
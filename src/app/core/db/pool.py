@@ -0,0 +1,64 @@
+import time
+from collections.abc import Callable
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Called with the seconds each checkout waited, e.g. to feed a metrics histogram
+pool_wait_listeners: list[Callable[[float], None]] = []
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            for listener in pool_wait_listeners:
+                listener(waited)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkouts, pool.timeouts = self.checkouts, self.timeouts
+        pool.total_wait, pool.max_wait = self.total_wait, self.max_wait
+        return pool
+
+
+def get_pool_status(engine: AsyncEngine) -> dict[str, int | float]:
+    """Return a snapshot of an engine's connection pool usage."""
+    pool = engine.pool
+    status: dict[str, int | float] = {}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        status.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            total_wait_seconds=round(pool.total_wait, 6),
+            max_wait_seconds=round(pool.max_wait, 6),
+            avg_wait_seconds=round(pool.total_wait / pool.checkouts, 6) if pool.checkouts else 0.0,
+        )
+    return status
@@ -0,0 +1,43 @@
+import time
+from collections.abc import Callable
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Called with the statement and the seconds it took, e.g. to feed metrics or request stats
+StatementListener = Callable[[str, float], None]
+
+_statement_listeners: dict[Engine, list[StatementListener]] = {}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.statement_started_at = time.perf_counter()
+
+
+def add_statement_listener(engine: AsyncEngine, listener: StatementListener) -> None:
+    """Call `listener(statement, seconds)` after every statement `engine` runs successfully.
+
+    Each engine gets a single pair of cursor events however many listeners it has. The
+    start time lives on the statement's execution context, which is discarded with it,
+    so a statement that fails leaves nothing behind on the pooled connection.
+    """
+    sync_engine = engine.sync_engine
+    listeners = _statement_listeners.get(sync_engine)
+    if listeners is None:
+        listeners = _statement_listeners[sync_engine] = []
+
+        def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = getattr(context, "statement_started_at", None)
+            if started is None:
+                return
+            duration = time.perf_counter() - started
+            for notify in listeners:
+                notify(statement, duration)
+
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+    if listener not in listeners:
+        listeners.append(listener)
@@ -0,0 +1,121 @@
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from app.core.config import settings
+from app.core.db.database import local_session
+from app.core.email import send_magic_link_email, send_welcome_email
+from app.core.logger import logging
+from app.crud.email_outbox import claim_due_emails, mark_email_failed, mark_email_sent
+from app.models.email_outbox import EmailKind, EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+EMAIL_SENDERS: dict[str, Callable[..., Awaitable[None]]] = {
+    EmailKind.MAGIC_LINK.value: send_magic_link_email,
+    EmailKind.WELCOME.value: send_welcome_email,
+}
+
+
+class EmailDispatcher:
+    """Background worker that delivers emails from the outbox.
+
+    Due rows are claimed in batches and sent with at most `concurrency` SMTP
+    conversations in flight. Failures are retried with exponential backoff and
+    dead-lettered after `max_attempts`.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_base: float,
+        lease: float,
+    ):
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.lease = timedelta(seconds=lease)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="email-dispatcher")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def notify(self) -> None:
+        """Wake the dispatcher after an email has been enqueued."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        delay = min(self.retry_base * 2 ** (attempts - 1), 3600)
+        return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+    async def dispatch_once(self) -> int:
+        """Claim and deliver one batch of due emails, returning how many were claimed."""
+        async with local_session() as db:
+            emails = await claim_due_emails(db, self.batch_size, self.lease)
+        await asyncio.gather(*(self._deliver(email) for email in emails))
+        return len(emails)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Email dispatcher iteration failed: {str(e)}")
+                claimed = 0
+
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def _deliver(self, email: EmailOutbox) -> None:
+        async with self._semaphore:
+            try:
+                await EMAIL_SENDERS[email.kind](**email.payload)
+            except Exception as e:
+                if email.attempts >= self.max_attempts:
+                    logger.error(f"Dead-lettering {email.kind} email {email.id} after {email.attempts} attempts")
+                    retry_at = None
+                else:
+                    retry_at = datetime.now(UTC) + self.retry_delay(email.attempts)
+                async with local_session() as db:
+                    await mark_email_failed(db, email.id, str(e), retry_at)
+                return
+
+            async with local_session() as db:
+                await mark_email_sent(db, email.id)
+
+
+email_dispatcher = EmailDispatcher(
+    concurrency=settings.EMAIL_OUTBOX_CONCURRENCY,
+    batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+    poll_interval=settings.EMAIL_OUTBOX_POLL_SECONDS,
+    max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+    retry_base=settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS,
+    lease=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+)
@@ -0,0 +1,80 @@
+import html
+import re
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from app.core.config import settings
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class CompiledTemplate:
+    """A template parsed once into a `str.format` pattern.
+
+    `{{ field }}` placeholders found in `constants` are substituted at compile time,
+    so rendering only formats the per-recipient fields. HTML templates escape
+    every substituted value.
+    """
+
+    def __init__(self, source: str, escape: bool, constants: dict[str, Any]):
+        self.escape = escape
+        self.fields: list[str] = []
+
+        parts = _PLACEHOLDER.split(source)
+        pattern = []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                pattern.append(part.replace("{", "{{").replace("}", "}}"))
+            elif part in constants:
+                pattern.append(self._escape(constants[part]).replace("{", "{{").replace("}", "}}"))
+            else:
+                pattern.append("{" + part + "}")
+                self.fields.append(part)
+
+        self._format = "".join(pattern).format
+
+    def _escape(self, value: Any) -> str:
+        return html.escape(str(value)) if self.escape else str(value)
+
+    def render(self, **context: Any) -> str:
+        return self._format(**{field: self._escape(context[field]) for field in self.fields})
+
+
+class RenderedEmail(NamedTuple):
+    html: str
+    text: str
+
+
+class EmailTemplateRegistry:
+    """Loads and compiles every `<name>.html` / `<name>.txt` pair in a directory once."""
+
+    def __init__(self, template_dir: Path, constants: dict[str, Any]):
+        self.template_dir = template_dir
+        self.constants = constants
+        self._templates: dict[str, tuple[CompiledTemplate, CompiledTemplate]] = {}
+
+    def load(self) -> None:
+        templates = {}
+        for html_path in sorted(self.template_dir.glob("*.html")):
+            text_path = html_path.with_suffix(".txt")
+            templates[html_path.stem] = (
+                CompiledTemplate(html_path.read_text(encoding="utf-8"), escape=True, constants=self.constants),
+                CompiledTemplate(text_path.read_text(encoding="utf-8"), escape=False, constants=self.constants),
+            )
+        self._templates = templates
+
+    def render(self, template_name: str, /, **context: Any) -> RenderedEmail:
+        html_template, text_template = self._templates[template_name]
+        return RenderedEmail(html=html_template.render(**context), text=text_template.render(**context))
+
+
+email_templates = EmailTemplateRegistry(
+    TEMPLATE_DIR,
+    constants={
+        "base_url": settings.BASE_URL,
+        "magic_link_expire_minutes": settings.MAGIC_LINK_EXPIRE_MINUTES,
+    },
+)
+email_templates.load()
@@ -0,0 +1,282 @@
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import principal_cache
+from app.core.db import pool as db_pool
+from app.core.db.timing import add_statement_listener
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple[str, ...], labels: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(labelnames, labels, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric(ABC):
+    """A metric family: one child per combination of label values, created on first use.
+
+    Every metric is updated the same way, `metric.labels(*values).<update>(amount)`;
+    a metric without labels has a single child, `metric.labels()`.
+    """
+
+    type: str
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+
+    def labels(self, *values: str) -> Any:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}", *self.samples()]
+
+    @abstractmethod
+    def _new_child(self) -> Any: ...
+
+    @abstractmethod
+    def samples(self) -> list[str]: ...
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self.value += amount
+
+
+class _GaugeChild:
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        # One non-cumulative count per bucket plus +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {child.value}"
+            for labels, child in self._children.items()
+        ]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def samples(self) -> list[str]:
+        lines = []
+        for labels, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), child.counts, strict=True):
+                cumulative += count
+                le = _format_labels(self.labelnames, labels, extra=f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {child.sum}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds application metrics and renders them in the Prometheus text format.
+
+    Collectors are callables run at scrape time to refresh gauges that mirror state
+    owned elsewhere, such as pool or cache statistics.
+    """
+
+    def __init__(self):
+        self.metrics: list[Metric] = []
+        self.collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        for collect in self.collectors:
+            collect()
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(
+    Counter("http_requests_total", "HTTP requests by route, method and status.", ["method", "route", "status"])
+)
+http_request_duration_seconds = registry.register(
+    Histogram("http_request_duration_seconds", "HTTP request latency by route.", ["method", "route"])
+)
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being served.", ["method"])
+)
+db_statement_duration_seconds = registry.register(
+    Histogram("db_statement_duration_seconds", "Database statement execution time.", ["engine", "statement"])
+)
+db_pool_wait_seconds = registry.register(
+    Histogram("db_pool_wait_seconds", "Time spent waiting to check out a pooled connection.")
+)
+db_pool_connections = registry.register(
+    Gauge("db_pool_connections", "Pooled connections by state.", ["engine", "state"])
+)
+principal_cache_events_total = registry.register(
+    Counter("principal_cache_events_total", "Principal cache hits, misses and evictions.", ["event"])
+)
+principal_cache_size = registry.register(Gauge("principal_cache_size", "Entries held in the principal cache."))
+
+_instrumented_engines: dict[str, AsyncEngine] = {}
+
+
+def _collect_pool_status() -> None:
+    for engine_name, engine in _instrumented_engines.items():
+        status = db_pool.get_pool_status(engine)
+        for state in ("checked_in", "checked_out", "overflow"):
+            if state in status:
+                db_pool_connections.labels(engine_name, state).set(status[state])
+
+
+def _collect_principal_cache_stats() -> None:
+    stats = principal_cache.stats()
+    for name in ("hits", "misses", "evictions"):
+        # The cache keeps its own running totals; advance the counter to match
+        events = principal_cache_events_total.labels(name)
+        events.inc(stats[name] - events.value)
+    principal_cache_size.labels().set(stats["size"])
+
+
+registry.collectors.extend([_collect_pool_status, _collect_principal_cache_stats])
+
+
+def statement_kind(statement: str) -> str:
+    """Return the leading SQL keyword of a statement, e.g. SELECT or UPDATE."""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword.isalpha() else "OTHER"
+
+
+def instrument_engine(engine: AsyncEngine, engine_name: str) -> None:
+    """Record per-statement timings and pool usage for an engine."""
+    if engine_name in _instrumented_engines:
+        return
+    _instrumented_engines[engine_name] = engine
+
+    def _observe_statement(statement: str, duration: float) -> None:
+        db_statement_duration_seconds.labels(engine_name, statement_kind(statement)).observe(duration)
+
+    add_statement_listener(engine, _observe_statement)
+
+    observe_pool_wait = db_pool_wait_seconds.labels().observe
+    if observe_pool_wait not in db_pool.pool_wait_listeners:
+        db_pool.pool_wait_listeners.append(observe_pool_wait)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status and in-flight counts per route template."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = http_requests_in_flight.labels(method)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            http_request_duration_seconds.labels(method, route).observe(time.perf_counter() - started)
+            http_requests_total.labels(method, route, str(status_code)).inc()
+
+
+def create_metrics_router(path: str) -> APIRouter:
+    metrics_router = APIRouter()
+
+    @metrics_router.get(path, include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+    return metrics_router
@@ -0,0 +1,35 @@
+import base64
+import json
+from datetime import UTC, datetime, timedelta
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def sync_watermark(updated_since: datetime, now: datetime, lag: float) -> datetime:
+    """Get the watermark a client should pass as `updated_since` on its next delta sync.
+
+    Changes committed late, or not yet replayed on a replica, can carry an updated_at
+    slightly in the past, so the watermark is held `lag` seconds behind `now` and the
+    next sync overlaps them. It never moves back before `updated_since`, which is taken
+    to be UTC when naive.
+    """
+    if updated_since.tzinfo is None:
+        updated_since = updated_since.replace(tzinfo=UTC)
+    return max(now - timedelta(seconds=lag), updated_since)
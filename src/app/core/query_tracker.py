@@ -0,0 +1,96 @@
+import re
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.db.timing import add_statement_listener
+from app.core.logger import logging
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a statement so queries differing only in bound parameters compare equal."""
+    return _WHITESPACE.sub(" ", _PLACEHOLDER_LIST.sub("?", statement)).strip()
+
+
+class RequestQueryStats:
+    """Statements issued while serving a single request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def _record_statement(statement: str, duration: float) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def track_engine_queries(engine: AsyncEngine) -> None:
+    """Attribute every statement run on `engine` to the request being served, if any."""
+    add_statement_listener(engine, _record_statement)
+
+
+class QueryTrackerMiddleware:
+    """ASGI middleware that counts statements and database time per request.
+
+    Logs a warning when a request issues more than `query_budget` statements or runs
+    the same statement shape `repeat_threshold` times or more, which usually means an
+    N+1 pattern. With `server_timing` set, the totals are also sent to the client as a
+    `Server-Timing` header.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: int, repeat_threshold: int, server_timing: bool = False):
+        self.app = app
+        self.query_budget = query_budget
+        self.repeat_threshold = repeat_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if self.server_timing and message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"')
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            self._check(scope, stats)
+
+    def _check(self, scope: Scope, stats: RequestQueryStats) -> None:
+        route = getattr(scope.get("route"), "path", None) or scope["path"]
+        endpoint = f"{scope['method']} {route}"
+        if stats.count > self.query_budget:
+            logger.warning(
+                f"{endpoint} ran {stats.count} queries ({stats.duration * 1000:.1f} ms), "
+                f"over the budget of {self.query_budget}"
+            )
+        for shape, times in stats.shapes.items():
+            if times >= self.repeat_threshold:
+                logger.warning(f"{endpoint} ran the same statement {times} times, possible N+1: {shape[:200]}")
@@ -0,0 +1,68 @@
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+
+
+class TokenBucketLimiter:
+    """In-memory token buckets allowing `limit` requests per `window` seconds per key.
+
+    Each key's bucket holds up to `limit` tokens and refills continuously. Buckets are
+    kept in least-recently-used order, so ones that have refilled completely can be
+    swept from the front a few at a time; every operation is O(1) amortised. At most
+    `max_keys` buckets are kept, dropping the least recently used. A `limit` of 0
+    disables the limiter. Raises ValueError if `window` is not positive.
+    """
+
+    def __init__(self, limit: int, window: float, max_keys: int = 100000):
+        if window <= 0:
+            raise ValueError(f"Rate limit window must be positive, got {window}")
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._refill_rate = limit / window
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def _tokens(self, key: str, now: float) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return float(self.limit)
+        tokens, updated_at = bucket
+        return min(float(self.limit), tokens + (now - updated_at) * self._refill_rate)
+
+    def retry_after(self, key: str, now: float | None = None) -> float:
+        """Return how many seconds until `key` may make a request; 0 if it may now."""
+        if self.limit <= 0:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        missing = 1.0 - self._tokens(key, now)
+        return missing / self._refill_rate if missing > 0 else 0.0
+
+    def consume(self, key: str, now: float | None = None) -> None:
+        """Take one token from `key`'s bucket."""
+        if self.limit <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        self._buckets[key] = (self._tokens(key, now) - 1.0, now)
+        self._buckets.move_to_end(key)
+        self._sweep(now)
+
+    def _sweep(self, now: float) -> None:
+        # Drop a couple of expired buckets per call; a full bucket is the same as no bucket
+        for _ in range(2):
+            key, (tokens, updated_at) = next(iter(self._buckets.items()))
+            if tokens + (now - updated_at) * self._refill_rate < self.limit:
+                break
+            del self._buckets[key]
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+login_rate_limiters = {
+    "email": TokenBucketLimiter(settings.LOGIN_RATE_LIMIT_PER_EMAIL, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS),
+    "ip": TokenBucketLimiter(settings.LOGIN_RATE_LIMIT_PER_IP, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS),
+    "global": TokenBucketLimiter(settings.LOGIN_RATE_LIMIT_GLOBAL, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS),
+}
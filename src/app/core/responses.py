@@ -0,0 +1,46 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response that validates and serializes its content with a prebuilt `TypeAdapter`.
+
+    ORM objects are read via attribute access and dumped straight to bytes by
+    pydantic-core, skipping FastAPI's response_model validation and its separate
+    jsonable/json.dumps encoding pass.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ):
+        self.adapter = adapter
+        super().__init__(content, status_code=status_code, headers=headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(content, from_attributes=True))
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """Streaming response that always closes its body generator when the response ends.
+
+    Starlette stops iterating the body when the client disconnects but leaves the
+    generator suspended, so sessions or subscriptions it holds would only be released
+    once it is garbage collected.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -1,21 +1,96 @@
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from contextlib import _AsyncGeneratorContextManager, asynccontextmanager
 from typing import Any
 
 import fastapi
 from fastapi import APIRouter, FastAPI
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
-from fastapi.openapi.utils import get_openapi
 
 from app.core.config import (
     AppSettings,
+    AuthSettings,
     DatabaseSettings,
+    EmailSettings,
     EnvironmentOption,
     EnvironmentSettings,
+    MetricsSettings,
+    TaskEventSettings,
 )
+from app.core.db.database import async_engine, replica_engine
+from app.core.email_dispatcher import email_dispatcher
+from app.core.metrics import MetricsMiddleware, create_metrics_router, instrument_engine
+from app.core.query_tracker import QueryTrackerMiddleware, track_engine_queries
+from app.core.task_events import task_event_broker
+from app.core.token_reaper import token_reaper
+from app.core.warmup import create_tables, warm_up_until_ready
+
+
+def lifespan_factory(
+    settings: (DatabaseSettings | AppSettings | AuthSettings | EmailSettings | EnvironmentSettings | TaskEventSettings),
+    create_tables_on_start: bool = True,
+) -> Callable[[FastAPI], _AsyncGeneratorContextManager[Any]]:
+    """Factory to create a lifespan async context manager for a FastAPI app.
+
+    Warm-up runs in the background once the server is accepting connections, so the
+    readiness endpoint can report progress; `app.state.ready` flips when it finishes.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator:
+        app.state.ready = False
+        warmup_task = None
+        if isinstance(settings, DatabaseSettings):
+            if create_tables_on_start:
+                await create_tables()
+            warmup_task = asyncio.create_task(
+                warm_up_until_ready(app, settings.DATABASE_POOL_PREFILL, settings.DATABASE_WARMUP_RETRY_SECONDS),
+                name="warm-up",
+            )
+        else:
+            app.state.ready = True
+
+        if isinstance(settings, EmailSettings):
+            email_dispatcher.start()
+        if isinstance(settings, AuthSettings):
+            token_reaper.start()
+        if isinstance(settings, TaskEventSettings) and settings.TASK_EVENTS_ENABLED:
+            task_event_broker.start()
+
+        try:
+            yield
+        finally:
+            app.state.ready = False
+            if warmup_task is not None:
+                warmup_task.cancel()
+                try:
+                    await warmup_task
+                except asyncio.CancelledError:
+                    pass
+            await task_event_broker.stop()
+            if isinstance(settings, AuthSettings):
+                await token_reaper.stop()
+            if isinstance(settings, EmailSettings):
+                await email_dispatcher.stop()
+            if isinstance(settings, DatabaseSettings):
+                await async_engine.dispose()
+                if replica_engine is not None:
+                    await replica_engine.dispose()
+
+    return lifespan
 
 
 def create_application(
     router: APIRouter,
-    settings: (DatabaseSettings | AppSettings | EnvironmentSettings),
+    settings: (
+        DatabaseSettings
+        | AppSettings
+        | AuthSettings
+        | EmailSettings
+        | EnvironmentSettings
+        | MetricsSettings
+        | TaskEventSettings
+    ),
     create_tables_on_start: bool = True,
     **kwargs: Any,
 ) -> FastAPI:
@@ -34,13 +109,23 @@ def create_application(
         It determines the configuration applied:
 
         - AppSettings: Configures basic app metadata like name, description, contact, and license info.
-        - DatabaseSettings: Adds event handlers for initializing database tables during startup.
+        - AuthSettings: Runs the expired auth token reaper for the lifetime of the application.
+        - DatabaseSettings: Optionally creates missing database tables during startup, then warms up in the
+          background: prefills the connection pool, primes the quadrant catalog and hot task queries and builds
+          the OpenAPI schema. `/ready` answers 503 until that has finished. Engines are disposed on shutdown.
+          Also counts the statements each request runs, warning about query budget overruns and repeated
+          statements. Outside production the totals are also returned in a `Server-Timing` header.
+        - EmailSettings: Runs the email outbox dispatcher for the lifetime of the application.
         - EnvironmentSettings: Conditionally sets documentation URLs and integrates custom routes for API documentation
           based on the environment type.
+        - MetricsSettings: When enabled, records route latencies and database timings and serves them in the
+          Prometheus text format at `METRICS_PATH`.
+        - TaskEventSettings: When enabled, listens for task change notifications for the lifetime of the
+          application and fans them out to `/tasks/events` subscribers.
 
     create_tables_on_start : bool
-        A flag to indicate whether to create database tables on application startup.
-        Defaults to True.
+        A flag to indicate whether to create missing database tables on application startup.
+        Defaults to True. Deployments whose schema is managed by Alembic should pass False.
 
     **kwargs
         Additional keyword arguments passed directly to the FastAPI constructor.
@@ -61,18 +146,46 @@ def create_application(
             "title": settings.APP_NAME,
             "description": settings.APP_DESCRIPTION,
             "contact": {"name": settings.CONTACT_NAME, "email": settings.CONTACT_EMAIL},
-            "license_info": {"name": settings.LICENSE_NAME},
         }
+        if settings.LICENSE_NAME:
+            to_update["license_info"] = {"name": settings.LICENSE_NAME}
         kwargs.update(to_update)
 
     if isinstance(settings, EnvironmentSettings):
         kwargs.update({"docs_url": None, "redoc_url": None, "openapi_url": None})
 
-    # lifespan = lifespan_factory(settings, create_tables_on_start=create_tables_on_start)
+    lifespan = lifespan_factory(settings, create_tables_on_start=create_tables_on_start)
 
-    application = FastAPI(**kwargs)
+    application = FastAPI(lifespan=lifespan, **kwargs)
+    application.state.ready = False
     application.include_router(router)
 
+    @application.get("/ready", include_in_schema=False)
+    async def readiness() -> fastapi.responses.JSONResponse:
+        if not application.state.ready:
+            return fastapi.responses.JSONResponse({"status": "starting"}, status_code=503)
+        return fastapi.responses.JSONResponse({"status": "ready"})
+
+    if isinstance(settings, DatabaseSettings):
+        track_engine_queries(async_engine)
+        if replica_engine is not None:
+            track_engine_queries(replica_engine)
+        application.add_middleware(
+            QueryTrackerMiddleware,
+            query_budget=settings.DATABASE_QUERY_BUDGET,
+            repeat_threshold=settings.DATABASE_REPEATED_QUERY_THRESHOLD,
+            server_timing=(
+                isinstance(settings, EnvironmentSettings) and settings.ENVIRONMENT != EnvironmentOption.PRODUCTION
+            ),
+        )
+
+    if isinstance(settings, MetricsSettings) and settings.METRICS_ENABLED:
+        instrument_engine(async_engine, "primary")
+        if replica_engine is not None:
+            instrument_engine(replica_engine, "replica")
+        application.add_middleware(MetricsMiddleware)
+        application.include_router(create_metrics_router(settings.METRICS_PATH))
+
     # if isinstance(settings, ClientSideCacheSettings):
     #     application.add_middleware(ClientCacheMiddleware, max_age=settings.CLIENT_CACHE_MAX_AGE)
 
@@ -92,8 +205,8 @@ def create_application(
 
             @docs_router.get("/openapi.json", include_in_schema=False)
             async def openapi() -> dict[str, Any]:
-                out: dict = get_openapi(title=application.title, version=application.version, routes=application.routes)
-                return out
+                # Built once and cached on the app, which warm-up does before the first request
+                return application.openapi()
 
             application.include_router(docs_router)
 
@@ -0,0 +1,127 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import asyncpg
+
+from app.core.config import settings
+from app.core.logger import logging
+
+logger = logging.getLogger(__name__)
+
+# Events are sent on this channel by the notify_task_events trigger on the task table
+TASK_EVENTS_CHANNEL = "task_events"
+
+
+def event_matches_quadrant(event: dict, quadrant_id: int | None) -> bool:
+    """Whether a subscriber watching `quadrant_id` should receive `event`.
+
+    A task moved out of the quadrant still matches through its `previous_quadrant_id`,
+    so the subscriber sees it leave. Events without a quadrant, such as `resync` or
+    `imported`, match every subscriber.
+    """
+    if not quadrant_id or "quadrant_id" not in event:
+        return True
+    return quadrant_id in (event["quadrant_id"], event.get("previous_quadrant_id"))
+
+
+class TaskEventBroker:
+    """Fans task change notifications out to in-process subscribers.
+
+    One dedicated LISTEN connection per worker receives every notification; each
+    payload is decoded once and put on the queue of every subscriber. A subscriber
+    that falls `queue_size` events behind is disconnected rather than slowing
+    everyone else down. The connection is re-established after `retry_interval`
+    seconds if it drops, and subscribers are then sent a `resync` event because
+    notifications published in the meantime are lost.
+    """
+
+    def __init__(self, dsn: str, queue_size: int, retry_interval: float):
+        self.dsn = dsn
+        self.queue_size = queue_size
+        self.retry_interval = retry_interval
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="task-event-broker")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        """Register a subscriber queue; a None item means the subscription has ended."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size + 1)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            events = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed task event payload: {payload[:200]}")
+            return
+        self._broadcast(events)
+
+    def _broadcast(self, events: list[dict]) -> None:
+        for queue in list(self._subscribers):
+            for event in events:
+                if queue.qsize() >= self.queue_size:
+                    logger.warning("Disconnecting a task event subscriber that fell behind")
+                    self._subscribers.discard(queue)
+                    queue.put_nowait(None)
+                    break
+                queue.put_nowait(event)
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(TASK_EVENTS_CHANNEL, self._on_notification)
+                logger.info(f"Listening for task events on {TASK_EVENTS_CHANNEL}")
+                # Anything published while we were disconnected was missed
+                self._broadcast([{"type": "resync"}])
+                await closed.wait()
+                logger.warning("Task event connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Task event listener failed: {str(e)}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.retry_interval)
+
+
+task_event_broker = TaskEventBroker(
+    dsn=f"{settings.POSTGRES_SYNC_PREFIX}{settings.POSTGRES_URI}",
+    queue_size=settings.TASK_EVENTS_QUEUE_SIZE,
+    retry_interval=settings.TASK_EVENTS_RETRY_SECONDS,
+)
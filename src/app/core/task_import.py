@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import Literal
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import quadrants as quadrant_crud
+from app.crud import tasks as task_crud
+from app.schemas.task import TaskImportResult, TaskImportRow, TaskImportRowError
+
+ImportFormat = Literal["csv", "ndjson"]
+
+
+def _csv_records(content: str) -> Iterator[tuple[int, dict]]:
+    # Empty cells mean "not set" so optional columns fall back to their defaults
+    for row_number, row in enumerate(csv.DictReader(io.StringIO(content)), start=1):
+        yield row_number, {key: value for key, value in row.items() if key and value not in ("", None)}
+
+
+def _ndjson_records(content: str) -> Iterator[tuple[int, dict | str]]:
+    for row_number, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row_number, f"Invalid JSON: {e}"
+            continue
+        yield row_number, record if isinstance(record, dict) else "Expected a JSON object"
+
+
+def parse_task_rows(
+    content: str, import_format: ImportFormat
+) -> tuple[list[tuple[int, TaskImportRow]], list[TaskImportRowError]]:
+    """Parse and validate CSV or NDJSON task rows.
+
+    Rows are numbered from 1 in file order (CSV rows after the header, NDJSON lines).
+    Returns the valid rows with their numbers and an error for each invalid row.
+    """
+    records = _csv_records(content) if import_format == "csv" else _ndjson_records(content)
+    rows: list[tuple[int, TaskImportRow]] = []
+    errors: list[TaskImportRowError] = []
+    for row_number, record in records:
+        if isinstance(record, str):
+            errors.append(TaskImportRowError(row=row_number, detail=record))
+            continue
+        try:
+            rows.append((row_number, TaskImportRow.model_validate(record)))
+        except ValidationError as e:
+            detail = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+            errors.append(TaskImportRowError(row=row_number, detail=detail))
+    return rows, errors
+
+
+async def import_tasks(db: AsyncSession, content: str, import_format: ImportFormat) -> TaskImportResult:
+    """Validate CSV or NDJSON task rows and load the valid ones in a single COPY.
+
+    Quadrant ids are checked against the quadrant catalog once for the whole file.
+    Invalid rows are skipped and reported; they do not prevent the rest from loading.
+    """
+    rows, errors = parse_task_rows(content, import_format)
+
+    quadrant_ids = await quadrant_crud.get_existing_quadrant_ids(db, {task.quadrant_id for _, task in rows})
+    valid = []
+    for row_number, task in rows:
+        if task.quadrant_id in quadrant_ids:
+            valid.append(task)
+        else:
+            errors.append(TaskImportRowError(row=row_number, detail="Invalid quadrant ID"))
+
+    imported = await task_crud.copy_tasks(db, valid) if valid else 0
+    errors.sort(key=lambda error: error.row)
+    return TaskImportResult(imported=imported, errors=errors)
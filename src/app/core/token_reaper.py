@@ -0,0 +1,78 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from app.core.config import settings
+from app.core.db.database import local_session
+from app.core.logger import logging
+from app.crud.auth import cleanup_expired_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class TokenReaper:
+    """Background job that periodically deletes expired auth tokens in bounded batches.
+
+    Each batch is its own short transaction, and a run stops after `max_batches` so a
+    large backlog is worked off over several runs instead of one long one.
+    """
+
+    def __init__(self, interval: float, batch_size: int, max_batches: int):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.last_run: dict | None = None
+        self.total_deleted = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="token-reaper")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> dict:
+        """Reap expired tokens and return the metrics for this run."""
+        started = time.perf_counter()
+        deleted = batches = batch_deleted = 0
+        while batches < self.max_batches:
+            async with local_session() as db:
+                batch_deleted = await cleanup_expired_tokens(db, batch_size=self.batch_size)
+            batches += 1
+            deleted += batch_deleted
+            if batch_deleted < self.batch_size:
+                break
+
+        self.total_deleted += deleted
+        self.last_run = {
+            "deleted": deleted,
+            "batches": batches,
+            "duration_seconds": round(time.perf_counter() - started, 3),
+            "backlog_remaining": batches == self.max_batches and batch_deleted == self.batch_size,
+            "finished_at": datetime.now(UTC).isoformat(),
+        }
+        logger.info(f"Token reaper run: {self.last_run}")
+        return self.last_run
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Token reaper run failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+
+token_reaper = TokenReaper(
+    interval=settings.TOKEN_REAPER_INTERVAL_SECONDS,
+    batch_size=settings.TOKEN_REAPER_BATCH_SIZE,
+    max_batches=settings.TOKEN_REAPER_MAX_BATCHES,
+)
@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.db.database import Base, async_engine, local_session, read_session, replica_engine
+from app.core.logger import logging
+from app.crud import quadrants as quadrant_crud
+from app.crud import tasks as task_crud
+
+logger = logging.getLogger(__name__)
+
+
+async def create_tables() -> None:
+    """Create any tables missing from the database; existing tables are left untouched."""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def prefill_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open and validate up to `connections` pooled connections, returning how many were opened.
+
+    The connections are held at the same time so the pool has to establish distinct ones,
+    then returned to it for the first requests to reuse.
+    """
+    pool_size = engine.pool.size() if hasattr(engine.pool, "size") else connections
+    held = []
+    try:
+        for _ in range(min(connections, pool_size)):
+            conn = await engine.connect()
+            held.append(conn)
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in held:
+            await conn.close()
+    return len(held)
+
+
+async def _prime_task_queries(db: AsyncSession) -> None:
+    await task_crud.get_tasks_version(db)
+    await task_crud.get_tasks_page(db, limit=1)
+
+
+async def prime_queries() -> None:
+    """Load the quadrant catalog and run the hottest task queries once.
+
+    With a replica configured the task queries also run through the read session, which
+    serves them in production; it falls back to the primary if the replica is down.
+    """
+    await quadrant_crud.get_quadrants_json()
+    async with local_session() as db:
+        await _prime_task_queries(db)
+    if replica_engine is not None:
+        async with read_session() as db:
+            await _prime_task_queries(db)
+
+
+async def warm_up(app: FastAPI, pool_prefill: int) -> None:
+    """Prepare the application to serve traffic, then mark it ready."""
+    started = time.perf_counter()
+    opened = await prefill_pool(async_engine, pool_prefill)
+    if replica_engine is not None:
+        opened += await prefill_pool(replica_engine, pool_prefill)
+    await prime_queries()
+    # Builds and caches the JSON schema of every route model
+    app.openapi()
+    app.state.ready = True
+    logger.info(f"Warm-up finished in {time.perf_counter() - started:.2f}s ({opened} connections opened)")
+
+
+async def warm_up_until_ready(app: FastAPI, pool_prefill: int, retry_interval: float) -> None:
+    """Run `warm_up`, retrying until it succeeds; the app reports not ready meanwhile."""
+    while True:
+        try:
+            await warm_up(app, pool_prefill)
+            return
+        except Exception as e:
+            logger.error(f"Warm-up failed, retrying in {retry_interval}s: {str(e)}")
+        await asyncio.sleep(retry_interval)
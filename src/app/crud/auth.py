@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.auth_token import AuthToken
@@ -10,10 +10,10 @@ from app.models.user import User
 async def create_auth_token(
     db: AsyncSession, user_id: int, ip_address: str | None = None, user_agent: str | None = None
 ) -> AuthToken:
+    """Create an auth token without committing, so it can share a transaction with its login email."""
     auth_token = AuthToken(user_id=user_id, ip_address=ip_address, user_agent=user_agent)
     db.add(auth_token)
-    await db.commit()
-    await db.refresh(auth_token)
+    await db.flush()
     return auth_token
 
 
@@ -44,12 +44,19 @@ async def mark_token_as_used(db: AsyncSession, token: AuthToken) -> None:
     await db.commit()
 
 
-async def cleanup_expired_tokens(db: AsyncSession) -> int:
-    result = await db.execute(select(AuthToken).where(AuthToken.expires_at < datetime.now(UTC)))
-    expired_tokens = result.scalars().all()
-
-    for token in expired_tokens:
-        await db.delete(token)
+async def cleanup_expired_tokens(db: AsyncSession, batch_size: int = 1000) -> int:
+    """Delete up to `batch_size` expired tokens in one statement, returning how many were removed.
 
+    Rows locked by a concurrent run are skipped, so each call only holds locks on its own batch.
+    """
+    expired = (
+        select(AuthToken.id)
+        .where(AuthToken.expires_at < datetime.now(UTC))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = delete(AuthToken).where(AuthToken.id.in_(expired)).execution_options(synchronize_session=False)
+    result = await db.execute(stmt)
     await db.commit()
-    return len(expired_tokens)
+    return result.rowcount
@@ -0,0 +1,69 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.email_outbox import EmailKind, EmailOutbox, EmailStatus
+
+
+async def enqueue_email(db: AsyncSession, kind: EmailKind, recipient: str, payload: dict) -> EmailOutbox:
+    """Add an email to the outbox for the dispatcher to send.
+
+    Nothing is committed: the email is written with the caller's transaction, so it is
+    only sent if the changes it refers to are committed too.
+    """
+    email = EmailOutbox(kind=kind.value, recipient=recipient, payload=payload)
+    db.add(email)
+    return email
+
+
+async def claim_due_emails(db: AsyncSession, limit: int, lease: timedelta) -> list[EmailOutbox]:
+    """Claim up to `limit` due emails for delivery.
+
+    Claimed rows stay pending but are pushed `lease` into the future, so if the worker
+    dies mid-send they become due again. Rows locked by other workers are skipped.
+    """
+    now = datetime.now(UTC)
+    due = (
+        select(EmailOutbox.id)
+        .where(EmailOutbox.status == EmailStatus.PENDING.value, EmailOutbox.next_attempt_at <= now)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(due))
+        .values(attempts=EmailOutbox.attempts + 1, next_attempt_at=now + lease)
+        .returning(EmailOutbox)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.scalars(stmt)
+    emails = list(result.all())
+    await db.commit()
+    return emails
+
+
+async def mark_email_sent(db: AsyncSession, email_id: int) -> None:
+    """Record a delivered email, dropping its payload so magic links and codes are not kept."""
+    stmt = (
+        update(EmailOutbox)
+        .where(EmailOutbox.id == email_id)
+        .values(status=EmailStatus.SENT.value, sent_at=datetime.now(UTC), last_error=None, payload={})
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def mark_email_failed(db: AsyncSession, email_id: int, error: str, retry_at: datetime | None) -> None:
+    """Record a failed attempt; with no `retry_at` the email is dead-lettered and its payload dropped."""
+    values = {"last_error": error}
+    if retry_at is None:
+        values["status"] = EmailStatus.DEAD.value
+        values["payload"] = {}
+    else:
+        values["next_attempt_at"] = retry_at
+
+    await db.execute(update(EmailOutbox).where(EmailOutbox.id == email_id).values(**values))
+    await db.commit()
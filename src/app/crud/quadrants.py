@@ -1,12 +1,112 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.db.database import local_session
+from app.core.etag import make_etag
 from app.models.quadrant import Quadrant
-from app.schemas.quadrant import QuadrantBase, QuadrantCreate
+from app.models.task import Task
+from app.schemas.quadrant import Quadrant as QuadrantSchema
+from app.schemas.quadrant import QuadrantBase, QuadrantCreate, QuadrantSummary
+
+_quadrant_list_adapter = TypeAdapter(list[QuadrantSchema])
+
+
+class QuadrantCatalog:
+    """Versioned in-memory snapshot of the quadrant table.
+
+    The whole table is loaded from the primary in one query, whatever session the
+    caller holds, so a lagging replica is never cached for every client; the snapshot
+    is kept for `ttl` seconds. Every write
+    through this module bumps `version`, which drops the snapshot in this process.
+    Quadrants created by another worker since the snapshot was taken are missing from
+    it, so lookups that miss are checked against the database before being rejected;
+    the snapshot is dropped if that finds new quadrants.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._expires_at = 0.0
+        self._by_id: dict[int, QuadrantSchema] = {}
+        self._list_json: dict[bool, bytes] = {}
+        self._list_etag: dict[bool, str] = {}
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._expires_at = 0.0
+
+    async def _ensure_loaded(self) -> None:
+        if time.monotonic() < self._expires_at:
+            return
+
+        async with self._lock:
+            if time.monotonic() < self._expires_at:
+                return
+
+            version = self.version
+            async with local_session() as db:
+                result = await db.execute(select(Quadrant).order_by(Quadrant.id))
+                quadrants = [QuadrantSchema.model_validate(q) for q in result.scalars().all()]
+
+            self._by_id = {q.id: q for q in quadrants}
+            self._list_json = {
+                True: _quadrant_list_adapter.dump_json(quadrants),
+                False: _quadrant_list_adapter.dump_json([q for q in quadrants if not q.is_default]),
+            }
+            self._list_etag = {key: make_etag(content) for key, content in self._list_json.items()}
+            # A write that landed while we were loading may not be in this snapshot,
+            # so only mark it fresh if nothing was invalidated in the meantime.
+            if version == self.version:
+                self._expires_at = time.monotonic() + self.ttl
+
+    async def get(self, db: AsyncSession, quadrant_id: int) -> QuadrantSchema | None:
+        await self._ensure_loaded()
+        quadrant = self._by_id.get(quadrant_id)
+        if quadrant is not None:
+            return quadrant
+
+        db_quadrant = await get_quadrant_by_id(db, quadrant_id)
+        if db_quadrant is None:
+            return None
+        self.invalidate()
+        return QuadrantSchema.model_validate(db_quadrant)
+
+    async def quadrants(self) -> list[QuadrantSchema]:
+        await self._ensure_loaded()
+        return list(self._by_id.values())
+
+    async def existing_ids(self, db: AsyncSession, quadrant_ids: set[int]) -> set[int]:
+        await self._ensure_loaded()
+        found = quadrant_ids & self._by_id.keys()
+        missing = quadrant_ids - found
+        if not missing:
+            return found
+
+        result = await db.scalars(select(Quadrant.id).where(Quadrant.id.in_(missing)))
+        created = set(result.all())
+        if created:
+            self.invalidate()
+        return found | created
+
+    async def list_json(self, include_default: bool = True) -> bytes:
+        await self._ensure_loaded()
+        return self._list_json[include_default]
+
+    async def list_etag(self, include_default: bool = True) -> str:
+        await self._ensure_loaded()
+        return self._list_etag[include_default]
+
+
+quadrant_catalog = QuadrantCatalog(ttl=settings.QUADRANT_CACHE_TTL_SECONDS)
 
 
 async def get_quadrants(db: AsyncSession, include_default: bool = True) -> list[Quadrant]:
@@ -26,6 +126,64 @@ async def get_quadrant_by_id(db: AsyncSession, quadrant_id: int) -> Quadrant | N
     return result.scalar_one_or_none()
 
 
+async def get_cached_quadrant(db: AsyncSession, quadrant_id: int) -> QuadrantSchema | None:
+    """Get a specific quadrant from the in-memory catalog."""
+    return await quadrant_catalog.get(db, quadrant_id)
+
+
+async def quadrant_exists(db: AsyncSession, quadrant_id: int) -> bool:
+    """Check that a quadrant exists without a database round trip when the catalog has it."""
+    return await quadrant_catalog.get(db, quadrant_id) is not None
+
+
+async def get_existing_quadrant_ids(db: AsyncSession, quadrant_ids: set[int]) -> set[int]:
+    """Get which of `quadrant_ids` exist, querying the database only for catalog misses."""
+    return await quadrant_catalog.existing_ids(db, quadrant_ids)
+
+
+async def get_quadrant_summaries(db: AsyncSession) -> list[QuadrantSummary]:
+    """Get task counts for every quadrant from a single GROUP BY over non-deleted tasks."""
+    overdue = ~Task.completed & (Task.due_date < func.now())
+    stmt = (
+        select(
+            Task.quadrant_id,
+            func.count().label("total"),
+            func.count().filter(Task.completed).label("completed"),
+            func.count().filter(overdue).label("overdue"),
+        )
+        .where(~Task.is_deleted)
+        .group_by(Task.quadrant_id)
+    )
+    result = await db.execute(stmt)
+    counts = {row.quadrant_id: row for row in result}
+
+    summaries = []
+    for quadrant in await quadrant_catalog.quadrants():
+        row = counts.get(quadrant.id)
+        total, completed, overdue_count = (row.total, row.completed, row.overdue) if row else (0, 0, 0)
+        summaries.append(
+            QuadrantSummary(
+                quadrant_id=quadrant.id,
+                name=quadrant.name,
+                total=total,
+                open=total - completed,
+                completed=completed,
+                overdue=overdue_count,
+            )
+        )
+    return summaries
+
+
+async def get_quadrants_json(include_default: bool = True) -> bytes:
+    """Get all quadrants as a pre-serialized JSON array."""
+    return await quadrant_catalog.list_json(include_default=include_default)
+
+
+async def get_quadrants_etag(include_default: bool = True) -> str:
+    """Get the ETag of the pre-serialized quadrant list."""
+    return await quadrant_catalog.list_etag(include_default=include_default)
+
+
 async def create_quadrant(db: AsyncSession, quadrant: QuadrantCreate) -> Quadrant:
     """Create a new custom quadrant."""
     db_quadrant = Quadrant(
@@ -36,28 +194,33 @@ async def create_quadrant(db: AsyncSession, quadrant: QuadrantCreate) -> Quadran
     )
     db.add(db_quadrant)
     await db.commit()
+    quadrant_catalog.invalidate()
     await db.refresh(db_quadrant)
     return db_quadrant
 
 
 async def update_quadrant(db: AsyncSession, quadrant_id: int, quadrant_update: QuadrantBase) -> Quadrant | None:
     """Update a quadrant's details."""
-    db_quadrant = await get_quadrant_by_id(db, quadrant_id)
-    if not db_quadrant:
+    cached = await quadrant_catalog.get(db, quadrant_id)
+    if not cached:
         return None
 
     # Prevent modification of default quadrants
-    if db_quadrant.is_default:
+    if cached.is_default:
         raise ValueError("Cannot modify default quadrant")
 
     # Update with new values
     update_data = quadrant_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_quadrant, key, value)
-
-    db_quadrant.updated_at = datetime.now(UTC)
+    stmt = (
+        update(Quadrant)
+        .where(Quadrant.id == quadrant_id, ~Quadrant.is_default)
+        .values(**update_data, updated_at=datetime.now(UTC))
+        .returning(Quadrant)
+    )
+    result = await db.scalars(stmt)
+    db_quadrant = result.one_or_none()
     await db.commit()
-    await db.refresh(db_quadrant)
+    quadrant_catalog.invalidate()
     return db_quadrant
 
 
@@ -83,4 +246,5 @@ async def delete_quadrant(db: AsyncSession, quadrant_id: int) -> bool:
 
     await db.delete(db_quadrant)
     await db.commit()
+    quadrant_catalog.invalidate()
     return True
@@ -1,20 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, insert, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import websearch_to_tsquery
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.task import Task
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.task import SEARCH_CONFIG, Task, TaskVersion
 from app.schemas.task import TaskCreate, TaskUpdate
 
 
-async def get_tasks(
-    db: AsyncSession, quadrant_id: int | None = None, completed: bool | None = None, include_deleted: bool = False
-) -> list[Task]:
-    """Get tasks with optional filtering."""
-    stmt = select(Task)
-
+def _filter_tasks(
+    stmt: Select, quadrant_id: int | None = None, completed: bool | None = None, include_deleted: bool = False
+) -> Select:
     if not include_deleted:
         stmt = stmt.where(~Task.is_deleted)
 
@@ -24,10 +24,132 @@ async def get_tasks(
     if completed is not None:
         stmt = stmt.where(Task.completed == completed)
 
+    return stmt
+
+
+async def get_tasks(
+    db: AsyncSession,
+    quadrant_id: int | None = None,
+    completed: bool | None = None,
+    include_deleted: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> list[Task]:
+    """Get tasks with optional filtering, ordered by (created_at, id).
+
+    When `cursor` is given only tasks after that keyset position are returned.
+    Raises ValueError if the cursor is malformed.
+    """
+    stmt = select(Task).order_by(Task.created_at, Task.id)
+    stmt = _filter_tasks(stmt, quadrant_id=quadrant_id, completed=completed, include_deleted=include_deleted)
+
+    if cursor:
+        created_at, task_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Task.created_at, Task.id) > tuple_(created_at, task_id))
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
     result = await db.execute(stmt)
     return list(result.scalars().all())
 
 
+async def get_tasks_page(
+    db: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+    quadrant_id: int | None = None,
+    completed: bool | None = None,
+) -> tuple[list[Task], str | None]:
+    """Get one page of tasks and the cursor for the next page, if any."""
+    tasks = await get_tasks(db, quadrant_id=quadrant_id, completed=completed, limit=limit + 1, cursor=cursor)
+    if len(tasks) <= limit:
+        return tasks, None
+
+    tasks = tasks[:limit]
+    last = tasks[-1]
+    return tasks, encode_cursor(last.created_at, last.id)
+
+
+async def stream_tasks(
+    db: AsyncSession,
+    quadrant_id: int | None = None,
+    completed: bool | None = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[list[Task]]:
+    """Stream tasks ordered by (created_at, id) in batches of up to `batch_size`.
+
+    Rows are read through a server-side cursor, so memory use is bounded by the batch size.
+    """
+    stmt = select(Task).order_by(Task.created_at, Task.id)
+    stmt = _filter_tasks(stmt, quadrant_id=quadrant_id, completed=completed)
+    result = await db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+async def get_task_changes(
+    db: AsyncSession, updated_since: datetime, limit: int, cursor: str | None = None
+) -> tuple[list[Task], str | None]:
+    """Get tasks created, updated or soft deleted after `updated_since`, oldest change first.
+
+    Soft-deleted rows are included so callers can send tombstones. Returns one page and
+    the cursor for the next page, if any. Raises ValueError if the cursor is malformed.
+    """
+    stmt = select(Task).where(Task.updated_at > updated_since).order_by(Task.updated_at, Task.id).limit(limit + 1)
+    if cursor:
+        updated_at, task_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Task.updated_at, Task.id) > tuple_(updated_at, task_id))
+
+    result = await db.execute(stmt)
+    tasks = list(result.scalars().all())
+    if len(tasks) <= limit:
+        return tasks, None
+
+    tasks = tasks[:limit]
+    last = tasks[-1]
+    return tasks, encode_cursor(last.updated_at, last.id)
+
+
+async def search_tasks(
+    db: AsyncSession,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    quadrant_id: int | None = None,
+    completed: bool | None = None,
+) -> tuple[list[Task], int | None]:
+    """Full-text search task titles and descriptions, best matches first.
+
+    `query` accepts web search syntax ("quoted phrases", OR, -excluded). Returns one page
+    of tasks and the offset of the next page, if any.
+    """
+    ts_query = websearch_to_tsquery(SEARCH_CONFIG, query)
+    stmt = (
+        select(Task)
+        .where(Task.search_vector.bool_op("@@")(ts_query))
+        .order_by(func.ts_rank_cd(Task.search_vector, ts_query).desc(), Task.id.desc())
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    stmt = _filter_tasks(stmt, quadrant_id=quadrant_id, completed=completed)
+    result = await db.execute(stmt)
+    tasks = list(result.scalars().all())
+    if len(tasks) <= limit:
+        return tasks, None
+    return tasks[:limit], offset + limit
+
+
+async def get_tasks_version(db: AsyncSession) -> int:
+    """Get the task change counter, the sum of a few counter rows.
+
+    Every committed write to the task table increases it, including ones outside any
+    particular filtered collection, so it can only err towards reporting a change.
+    """
+    result = await db.execute(select(func.coalesce(func.sum(TaskVersion.version), 0)))
+    return int(result.scalar_one())
+
+
 async def get_task_by_id(db: AsyncSession, task_id: int) -> Task | None:
     """Get a specific task by ID."""
     stmt = select(Task).where(Task.id == task_id, ~Task.is_deleted)
@@ -50,59 +172,128 @@ async def create_task(db: AsyncSession, task: TaskCreate) -> Task:
     return db_task
 
 
+async def _update_task(db: AsyncSession, task_id: int, **values) -> Task | None:
+    stmt = update(Task).where(Task.id == task_id, ~Task.is_deleted).values(**values).returning(Task)
+    result = await db.scalars(stmt)
+    db_task = result.one_or_none()
+    await db.commit()
+    return db_task
+
+
 async def update_task(db: AsyncSession, task_id: int, task_update: TaskUpdate) -> Task | None:
     """Update a task's details."""
-    db_task = await get_task_by_id(db, task_id)
-    if not db_task:
-        return None
-
-    # Update with new values
     update_data = task_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        if key == "quadrant_id" and value:
-            setattr(db_task, key, int(value))
-        else:
-            setattr(db_task, key, value)
+    if update_data.get("quadrant_id"):
+        update_data["quadrant_id"] = int(update_data["quadrant_id"])
 
-    db_task.updated_at = datetime.now(UTC)
-    await db.commit()
-    await db.refresh(db_task)
-    return db_task
+    return await _update_task(db, task_id, **update_data, updated_at=datetime.now(UTC))
 
 
 async def update_task_quadrant(db: AsyncSession, task_id: int, quadrant_id: int) -> Task | None:
     """Move a task to a different quadrant."""
-    db_task = await get_task_by_id(db, task_id)
-    if not db_task:
-        return None
-
-    db_task.quadrant_id = quadrant_id
-    db_task.updated_at = datetime.now(UTC)
-    await db.commit()
-    await db.refresh(db_task)
-    return db_task
+    return await _update_task(db, task_id, quadrant_id=quadrant_id, updated_at=datetime.now(UTC))
 
 
 async def toggle_task_completion(db: AsyncSession, task_id: int, completed: bool) -> Task | None:
     """Mark a task as complete or incomplete."""
-    db_task = await get_task_by_id(db, task_id)
-    if not db_task:
-        return None
-
-    db_task.completed = completed
-    db_task.updated_at = datetime.now(UTC)
-    await db.commit()
-    await db.refresh(db_task)
-    return db_task
+    return await _update_task(db, task_id, completed=completed, updated_at=datetime.now(UTC))
 
 
 async def delete_task(db: AsyncSession, task_id: int) -> bool:
     """Soft delete a task."""
-    db_task = await get_task_by_id(db, task_id)
-    if not db_task:
-        return False
+    now = datetime.now(UTC)
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, ~Task.is_deleted)
+        .values(is_deleted=True, deleted_at=now, updated_at=now)
+        .returning(Task.id)
+    )
+    result = await db.scalars(stmt)
+    deleted = result.one_or_none() is not None
+    await db.commit()
+    return deleted
 
-    db_task.is_deleted = True
-    db_task.deleted_at = datetime.now(UTC)
+
+async def create_tasks(db: AsyncSession, tasks: list[TaskCreate]) -> list[Task]:
+    """Create several tasks with a single INSERT, returned in input order."""
+    stmt = insert(Task).returning(Task, sort_by_parameter_order=True)
+    values = [
+        {
+            "title": task.title,
+            "description": task.description,
+            "due_date": task.due_date,
+            "quadrant_id": int(task.quadrant_id),
+            "completed": task.completed,
+        }
+        for task in tasks
+    ]
+    result = await db.scalars(stmt, values)
+    db_tasks = list(result.all())
+    await db.commit()
+    return db_tasks
+
+
+COPY_COLUMNS = (
+    "title",
+    "description",
+    "due_date",
+    "quadrant_id",
+    "completed",
+    "created_at",
+    "updated_at",
+    "is_deleted",
+)
+
+
+async def copy_tasks(db: AsyncSession, tasks: list[TaskCreate]) -> int:
+    """Bulk load tasks with a binary COPY and commit, returning how many were loaded.
+
+    COPY bypasses ORM defaults, so every column is supplied explicitly.
+    """
+    now = datetime.now(UTC)
+    records = [
+        (task.title, task.description, task.due_date, int(task.quadrant_id), task.completed, now, now, False)
+        for task in tasks
+    ]
+    conn = await db.connection()
+    driver_conn = (await conn.get_raw_connection()).driver_connection
+    if not driver_conn.is_in_transaction():
+        # The asyncpg adapter only begins its transaction with the first statement it
+        # runs; without one the COPY would autocommit on its own, outside the session
+        await conn.execute(text("SELECT 1"))
+    await driver_conn.copy_records_to_table(Task.__tablename__, records=records, columns=COPY_COLUMNS)
+    await db.commit()
+    return len(records)
+
+
+async def _update_tasks(db: AsyncSession, task_ids: list[int], **values) -> list[Task]:
+    stmt = update(Task).where(Task.id.in_(task_ids), ~Task.is_deleted).values(**values).returning(Task)
+    result = await db.scalars(stmt)
+    db_tasks = list(result.all())
+    await db.commit()
+    return db_tasks
+
+
+async def update_tasks_quadrant(db: AsyncSession, task_ids: list[int], quadrant_id: int) -> list[Task]:
+    """Move several tasks to a different quadrant with a single UPDATE."""
+    return await _update_tasks(db, task_ids, quadrant_id=quadrant_id, updated_at=datetime.now(UTC))
+
+
+async def set_tasks_completion(db: AsyncSession, task_ids: list[int], completed: bool) -> list[Task]:
+    """Mark several tasks as complete or incomplete with a single UPDATE."""
+    return await _update_tasks(db, task_ids, completed=completed, updated_at=datetime.now(UTC))
+
+
+async def delete_tasks(db: AsyncSession, task_ids: list[int]) -> list[int]:
+    """Soft delete several tasks with a single UPDATE, returning the deleted IDs."""
+    now = datetime.now(UTC)
+    stmt = (
+        update(Task)
+        .where(Task.id.in_(task_ids), ~Task.is_deleted)
+        .values(is_deleted=True, deleted_at=now, updated_at=now)
+        .returning(Task.id)
+    )
+    result = await db.scalars(stmt)
+    deleted_ids = list(result.all())
     await db.commit()
-    return True
+    return deleted_ids
@@ -1,8 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import Integer, bindparam, case, cast, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import principal_cache
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -22,21 +24,79 @@ async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     return result.scalars().first()
 
 
+async def get_available_username(db: AsyncSession, base_username: str) -> str:
+    """Find a free username of the form `base`, `base1`, `base2`, ... in a single query.
+
+    The base is shortened if the suffix would not fit in the username column.
+    """
+    max_length = User.username.type.length
+    base = base_username[:max_length]
+    while True:
+        # The prefix pattern is rendered as a literal: Postgres can serve the LIKE from
+        # ix_user_username_pattern only when it knows the prefix at plan time
+        pattern = base.replace("/", "//").replace("%", "/%").replace("_", "/_") + "%"
+        suffix = func.substring(User.username, len(base) + 1)
+        stmt = select(func.max(case((User.username == base, 0), else_=cast(suffix, Integer)))).where(
+            User.username.like(bindparam("pattern", pattern, literal_execute=True), escape="/"),
+            or_(User.username == base, suffix.regexp_match("^[0-9]{1,9}$")),
+        )
+        highest = (await db.execute(stmt)).scalar_one()
+        if highest is None:
+            return base
+
+        candidate = f"{base}{highest + 1}"
+        if len(candidate) <= max_length:
+            return candidate
+        base = base[: max_length - len(str(highest + 1))]
+
+
+# Unique index created for User.username
+USERNAME_CONSTRAINT = "ix_user_username"
+
+
+def _violated_constraint(error: IntegrityError) -> str | None:
+    # The DBAPI error wraps the asyncpg exception, which names the violated constraint
+    return getattr(error.orig.__cause__, "constraint_name", None)
+
+
 async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
+    """Insert a user without committing, so the caller can commit it with related rows."""
     user = User(**user_create.model_dump())
     db.add(user)
-    await db.commit()
+    await db.flush()
     await db.refresh(user)
     return user
 
 
+async def create_user_with_available_username(db: AsyncSession, user_create: UserCreate, attempts: int = 3) -> User:
+    """Create a user under the first free username derived from `user_create.username`.
+
+    The user is flushed but not committed. Each attempt runs in a savepoint, so if a
+    concurrent sign-up takes the same username first only that insert is rolled back
+    and allocation is retried, up to `attempts` times. Any other integrity error, such
+    as a duplicate email, is raised.
+    """
+    for attempt in range(attempts):
+        username = await get_available_username(db, user_create.username)
+        try:
+            async with db.begin_nested():
+                return await create_user(db, user_create.model_copy(update={"username": username}))
+        except IntegrityError as e:
+            if _violated_constraint(e) != USERNAME_CONSTRAINT or attempt == attempts - 1:
+                raise
+    raise ValueError(f"Could not allocate a username in {attempts} attempts")
+
+
 async def update_user(db: AsyncSession, user: User, user_update: UserUpdate) -> User:
     update_data = user_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    if not update_data:
+        return user
 
+    stmt = update(User).where(User.id == user.id).values(**update_data).returning(User)
+    result = await db.scalars(stmt)
+    user = result.one()
     await db.commit()
-    await db.refresh(user)
+    principal_cache.invalidate_user(user.id)
     return user
 
 
@@ -44,3 +104,4 @@ async def delete_user(db: AsyncSession, user: User) -> None:
     user.is_deleted = True
     user.deleted_at = datetime.utcnow()
     await db.commit()
+    principal_cache.invalidate_user(user.id)
@@ -1,7 +1,8 @@
 from .auth_token import AuthToken
+from .email_outbox import EmailOutbox
 from .quadrant import Quadrant
-from .task import Task
+from .task import Task, TaskVersion
 from .tier import Tier
 from .user import User
 
-__all__ = ["AuthToken", "Quadrant", "Task", "Tier", "User"]
+__all__ = ["AuthToken", "EmailOutbox", "Quadrant", "Task", "TaskVersion", "Tier", "User"]
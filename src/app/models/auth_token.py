@@ -33,7 +33,7 @@ class AuthToken(Base):
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
     expires_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC) + timedelta(minutes=15)
+        DateTime(timezone=True), index=True, default=lambda: datetime.now(UTC) + timedelta(minutes=15)
     )
     used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -3,7 +3,21 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db.database import Base
@@ -12,9 +26,39 @@ from app.core.db.mixins import SoftDeleteMixin, TimestampMixin
 if TYPE_CHECKING:
     from app.models.quadrant import Quadrant
 
+# Text search configuration used for both the stored vector and search queries
+SEARCH_CONFIG = "english"
+
 
 class Task(Base, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "task"
+    __table_args__ = (
+        Index("ix_task_created_at_id", "created_at", "id", postgresql_where=text("NOT is_deleted")),
+        Index(
+            "ix_task_quadrant_id_completed",
+            "quadrant_id",
+            "completed",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        Index("ix_task_completed", "completed", "created_at", "id", postgresql_where=text("NOT is_deleted")),
+        Index(
+            "ix_task_quadrant_summary",
+            "quadrant_id",
+            "completed",
+            "due_date",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+        # Not partial: delta sync has to see soft-deleted rows as tombstones
+        Index("ix_task_updated_at_id", "updated_at", "id"),
+        Index(
+            "ix_task_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("NOT is_deleted"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -22,5 +66,187 @@ class Task(Base, TimestampMixin, SoftDeleteMixin):
     due_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     quadrant_id: Mapped[int] = mapped_column(Integer, ForeignKey("quadrant.id"), nullable=False)
+    # Maintained by Postgres; deferred so regular task queries don't load it
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     quadrant: Mapped[Quadrant] = relationship("Quadrant", back_populates="tasks")
+
+
+# Number of counter rows in task_version; writers on different connections usually
+# land on different rows, so they don't queue behind each other
+TASK_VERSION_SLOTS = 16
+
+
+class TaskVersion(Base):
+    """Change counter for the task table, striped over `TASK_VERSION_SLOTS` rows.
+
+    Statement-level triggers on `task` bump one row, chosen by backend pid, in the
+    same transaction as every insert, update or delete that changes rows. The sum of
+    the rows therefore changes exactly when committed task data does and does not
+    depend on any clock. A transaction only holds the lock on its own slot, so task
+    writers are not serialised on a single hot row.
+    """
+
+    __tablename__ = "task_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+# Kept in step with the add_task_version and stripe_task_version migrations, for
+# databases built with create_all
+event.listen(
+    TaskVersion.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO task_version (id, version) "
+        f"SELECT slot, 0 FROM generate_series(0, {TASK_VERSION_SLOTS - 1}) AS slot"
+    ),
+)
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL(
+        f"""
+        CREATE OR REPLACE FUNCTION bump_task_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            -- Statements that matched no rows change nothing, so they leave the version alone
+            IF TG_OP <> 'TRUNCATE' THEN
+                IF NOT EXISTS (SELECT FROM changed_rows) THEN
+                    RETURN NULL;
+                END IF;
+            END IF;
+            UPDATE task_version SET version = version + 1 WHERE id = mod(pg_backend_pid(), {TASK_VERSION_SLOTS});
+            RETURN NULL;
+        END;
+        $$
+        """
+    ),
+)
+# Transition tables are only allowed on single-event triggers, hence one per operation
+for trigger, operation, transition in (
+    ("task_version_insert", "INSERT", "NEW TABLE AS changed_rows"),
+    ("task_version_update", "UPDATE", "NEW TABLE AS changed_rows"),
+    ("task_version_delete", "DELETE", "OLD TABLE AS changed_rows"),
+):
+    event.listen(
+        Task.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER {trigger} AFTER {operation} ON task REFERENCING {transition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+        ),
+    )
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER task_version_truncate AFTER TRUNCATE ON task "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    ),
+)
+
+# Task change events for app.core.task_events, sent by Postgres as part of each write
+# statement and delivered when its transaction commits. Kept in step with the
+# add_task_event_triggers migration. Moves carry the previous quadrant so clients
+# filtering on it see tasks leave.
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL(
+        """
+        CREATE OR REPLACE FUNCTION notify_task_events() RETURNS trigger LANGUAGE plpgsql AS $$
+        DECLARE
+            changed bigint;
+        BEGIN
+            SELECT count(*) INTO changed FROM new_rows;
+            IF changed = 0 THEN
+                RETURN NULL;
+            END IF;
+
+            -- Bulk loads and mass updates send a single event telling clients to reload
+            IF changed > 500 THEN
+                PERFORM pg_notify('task_events', CASE TG_OP
+                    WHEN 'INSERT' THEN jsonb_build_array(jsonb_build_object('type', 'imported', 'count', changed))
+                    ELSE jsonb_build_array(jsonb_build_object('type', 'resync'))
+                END::text);
+                RETURN NULL;
+            END IF;
+
+            -- NOTIFY payloads must stay under 8000 bytes, so events are sent 50 at a time
+            IF TG_OP = 'INSERT' THEN
+                PERFORM pg_notify('task_events', jsonb_agg(event)::text)
+                FROM (
+                    SELECT
+                        jsonb_build_object(
+                            'type', 'created',
+                            'id', id,
+                            'quadrant_id', quadrant_id,
+                            'completed', completed,
+                            'updated_at', updated_at
+                        ) AS event,
+                        (row_number() OVER () - 1) / 50 AS chunk
+                    FROM new_rows
+                ) AS events
+                GROUP BY chunk;
+            ELSE
+                PERFORM pg_notify('task_events', jsonb_agg(event)::text)
+                FROM (
+                    SELECT
+                        jsonb_build_object(
+                            'type', CASE
+                                WHEN n.is_deleted THEN 'deleted'
+                                WHEN (n.title, n.description, n.due_date)
+                                    IS DISTINCT FROM (o.title, o.description, o.due_date)
+                                    THEN 'updated'
+                                WHEN n.quadrant_id <> o.quadrant_id AND n.completed = o.completed THEN 'moved'
+                                WHEN n.quadrant_id = o.quadrant_id AND n.completed <> o.completed THEN 'completed'
+                                ELSE 'updated'
+                            END,
+                            'id', n.id,
+                            'quadrant_id', n.quadrant_id,
+                            'completed', n.completed,
+                            'updated_at', n.updated_at
+                        ) || CASE
+                            WHEN n.quadrant_id <> o.quadrant_id
+                                THEN jsonb_build_object('previous_quadrant_id', o.quadrant_id)
+                            ELSE '{}'::jsonb
+                        END AS event,
+                        (row_number() OVER () - 1) / 50 AS chunk
+                    FROM new_rows AS n
+                    JOIN old_rows AS o ON o.id = n.id
+                    WHERE NOT o.is_deleted
+                ) AS events
+                GROUP BY chunk;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    ),
+)
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER task_events_insert AFTER INSERT ON task REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()"
+    ),
+)
+event.listen(
+    Task.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER task_events_update AFTER UPDATE ON task "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()"
+    ),
+)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid as uuid_pkg
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db.database import Base
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 
 class User(Base, SoftDeleteMixin, TimestampMixin):
     __tablename__ = "user"
+    __table_args__ = (
+        Index("ix_user_username_pattern", "username", postgresql_ops={"username": "varchar_pattern_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -20,3 +20,12 @@ class Quadrant(QuadrantBase):
 
     class Config:
         from_attributes = True
+
+
+class QuadrantSummary(BaseModel):
+    quadrant_id: int
+    name: str
+    total: int
+    open: int
+    completed: int
+    overdue: int
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class TaskBase(BaseModel):
@@ -30,3 +30,67 @@ class Task(TaskBase):
 
     class Config:
         from_attributes = True
+
+
+class TaskPage(BaseModel):
+    items: list[Task]
+    next_cursor: str | None = None
+
+
+class TaskSearchPage(BaseModel):
+    items: list[Task]
+    next_offset: int | None = None
+
+
+class TaskSyncPage(BaseModel):
+    items: list[Task]
+    deleted_ids: list[int]
+    next_cursor: str | None = None
+    watermark: datetime
+
+
+task_adapter = TypeAdapter(Task)
+task_page_adapter = TypeAdapter(TaskPage)
+task_search_page_adapter = TypeAdapter(TaskSearchPage)
+task_sync_page_adapter = TypeAdapter(TaskSyncPage)
+
+
+class TaskBatchCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBatchIds(BaseModel):
+    task_ids: list[int] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBatchMove(TaskBatchIds):
+    quadrant_id: int
+
+
+class TaskBatchComplete(TaskBatchIds):
+    completed: bool
+
+
+class TaskBatchItemResult(BaseModel):
+    id: int | None = None
+    success: bool
+    detail: str | None = None
+    task: Task | None = None
+
+
+class TaskBatchResult(BaseModel):
+    results: list[TaskBatchItemResult]
+
+
+class TaskImportRow(TaskCreate):
+    title: str = Field(..., min_length=1, max_length=200)
+
+
+class TaskImportRowError(BaseModel):
+    row: int
+    detail: str
+
+
+class TaskImportResult(BaseModel):
+    imported: int
+    errors: list[TaskImportRowError]
@@ -0,0 +1,83 @@
+"""stripe task version
+
+Revision ID: 03e2b3f5cfc3
+Revises: 171601783669
+Create Date: 2026-10-18 19:05:37.640218
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "03e2b3f5cfc3"
+down_revision: str | None = "171601783669"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SLOTS = 16
+
+
+def upgrade() -> None:
+    # Existing row 1 keeps its count, so the summed version carries on from it
+    op.execute(
+        "INSERT INTO task_version (id, version) "
+        f"SELECT slot, 0 FROM generate_series(0, {SLOTS - 1}) AS slot ON CONFLICT (id) DO NOTHING"
+    )
+    op.execute("DROP TRIGGER task_version_bump ON task")
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION bump_task_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            -- Statements that matched no rows change nothing, so they leave the version alone
+            IF TG_OP <> 'TRUNCATE' THEN
+                IF NOT EXISTS (SELECT FROM changed_rows) THEN
+                    RETURN NULL;
+                END IF;
+            END IF;
+            UPDATE task_version SET version = version + 1 WHERE id = mod(pg_backend_pid(), {SLOTS});
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER task_version_insert AFTER INSERT ON task REFERENCING NEW TABLE AS changed_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    )
+    op.execute(
+        "CREATE TRIGGER task_version_update AFTER UPDATE ON task REFERENCING NEW TABLE AS changed_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    )
+    op.execute(
+        "CREATE TRIGGER task_version_delete AFTER DELETE ON task REFERENCING OLD TABLE AS changed_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    )
+    op.execute(
+        "CREATE TRIGGER task_version_truncate AFTER TRUNCATE ON task "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER task_version_truncate ON task")
+    op.execute("DROP TRIGGER task_version_delete ON task")
+    op.execute("DROP TRIGGER task_version_update ON task")
+    op.execute("DROP TRIGGER task_version_insert ON task")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_task_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE task_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER task_version_bump AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON task "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    )
+    op.execute("UPDATE task_version SET version = (SELECT sum(version) FROM task_version) WHERE id = 1")
+    op.execute("DELETE FROM task_version WHERE id <> 1")
@@ -0,0 +1,25 @@
+"""add auth_token expires_at index
+
+Revision ID: 0b69ce0a8de6
+Revises: c59ecf04d5e7
+Create Date: 2026-10-18 13:35:11.720463
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b69ce0a8de6"
+down_revision: str | None = "c59ecf04d5e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_auth_token_expires_at"), "auth_token", ["expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_auth_token_expires_at"), table_name="auth_token")
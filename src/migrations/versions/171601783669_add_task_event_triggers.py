@@ -0,0 +1,106 @@
+"""add task event triggers
+
+Revision ID: 171601783669
+Revises: c819d502e048
+Create Date: 2026-10-18 17:42:09.315604
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "171601783669"
+down_revision: str | None = "c819d502e048"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_task_events() RETURNS trigger LANGUAGE plpgsql AS $$
+        DECLARE
+            changed bigint;
+        BEGIN
+            SELECT count(*) INTO changed FROM new_rows;
+            IF changed = 0 THEN
+                RETURN NULL;
+            END IF;
+
+            -- Bulk loads and mass updates send a single event telling clients to reload
+            IF changed > 500 THEN
+                PERFORM pg_notify('task_events', CASE TG_OP
+                    WHEN 'INSERT' THEN jsonb_build_array(jsonb_build_object('type', 'imported', 'count', changed))
+                    ELSE jsonb_build_array(jsonb_build_object('type', 'resync'))
+                END::text);
+                RETURN NULL;
+            END IF;
+
+            -- NOTIFY payloads must stay under 8000 bytes, so events are sent 50 at a time
+            IF TG_OP = 'INSERT' THEN
+                PERFORM pg_notify('task_events', jsonb_agg(event)::text)
+                FROM (
+                    SELECT
+                        jsonb_build_object(
+                            'type', 'created',
+                            'id', id,
+                            'quadrant_id', quadrant_id,
+                            'completed', completed,
+                            'updated_at', updated_at
+                        ) AS event,
+                        (row_number() OVER () - 1) / 50 AS chunk
+                    FROM new_rows
+                ) AS events
+                GROUP BY chunk;
+            ELSE
+                PERFORM pg_notify('task_events', jsonb_agg(event)::text)
+                FROM (
+                    SELECT
+                        jsonb_build_object(
+                            'type', CASE
+                                WHEN n.is_deleted THEN 'deleted'
+                                WHEN (n.title, n.description, n.due_date)
+                                    IS DISTINCT FROM (o.title, o.description, o.due_date)
+                                    THEN 'updated'
+                                WHEN n.quadrant_id <> o.quadrant_id AND n.completed = o.completed THEN 'moved'
+                                WHEN n.quadrant_id = o.quadrant_id AND n.completed <> o.completed THEN 'completed'
+                                ELSE 'updated'
+                            END,
+                            'id', n.id,
+                            'quadrant_id', n.quadrant_id,
+                            'completed', n.completed,
+                            'updated_at', n.updated_at
+                        ) || CASE
+                            WHEN n.quadrant_id <> o.quadrant_id
+                                THEN jsonb_build_object('previous_quadrant_id', o.quadrant_id)
+                            ELSE '{}'::jsonb
+                        END AS event,
+                        (row_number() OVER () - 1) / 50 AS chunk
+                    FROM new_rows AS n
+                    JOIN old_rows AS o ON o.id = n.id
+                    WHERE NOT o.is_deleted
+                ) AS events
+                GROUP BY chunk;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER task_events_insert AFTER INSERT ON task REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()"
+    )
+    op.execute(
+        "CREATE TRIGGER task_events_update AFTER UPDATE ON task "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_task_events()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER task_events_update ON task")
+    op.execute("DROP TRIGGER task_events_insert ON task")
+    op.execute("DROP FUNCTION notify_task_events()")
@@ -0,0 +1,50 @@
+"""add task search vector
+
+Revision ID: 17b0c9725024
+Revises: 70d46f8a0130
+Create Date: 2026-10-18 14:40:05.918274
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "17b0c9725024"
+down_revision: str | None = "70d46f8a0130"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "task",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_task_search_vector",
+        "task",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_task_search_vector", table_name="task", postgresql_using="gin", postgresql_where=sa.text("NOT is_deleted")
+    )
+    op.drop_column("task", "search_vector")
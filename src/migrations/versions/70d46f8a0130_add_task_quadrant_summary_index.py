@@ -0,0 +1,32 @@
+"""add task quadrant summary index
+
+Revision ID: 70d46f8a0130
+Revises: 0b69ce0a8de6
+Create Date: 2026-10-18 14:12:48.306127
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "70d46f8a0130"
+down_revision: str | None = "0b69ce0a8de6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_quadrant_summary",
+        "task",
+        ["quadrant_id", "completed", "due_date"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_quadrant_summary", table_name="task", postgresql_where=sa.text("NOT is_deleted"))
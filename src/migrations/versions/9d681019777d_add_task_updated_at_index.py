@@ -0,0 +1,25 @@
+"""add task updated_at index
+
+Revision ID: 9d681019777d
+Revises: 17b0c9725024
+Create Date: 2026-10-18 15:06:32.417905
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d681019777d"
+down_revision: str | None = "17b0c9725024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_task_updated_at_id", "task", ["updated_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_updated_at_id", table_name="task")
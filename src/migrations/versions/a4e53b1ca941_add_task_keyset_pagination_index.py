@@ -0,0 +1,32 @@
+"""add task keyset pagination index
+
+Revision ID: a4e53b1ca941
+Revises: 564212423a72
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4e53b1ca941"
+down_revision: str | None = "564212423a72"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_created_at_id",
+        "task",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_created_at_id", table_name="task", postgresql_where=sa.text("NOT is_deleted"))
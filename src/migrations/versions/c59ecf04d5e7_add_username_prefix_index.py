@@ -0,0 +1,31 @@
+"""add username prefix index
+
+Revision ID: c59ecf04d5e7
+Revises: 6b1dac7e76e4
+Create Date: 2026-10-18 12:41:52.310876
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c59ecf04d5e7"
+down_revision: str | None = "6b1dac7e76e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_username_pattern",
+        "user",
+        ["username"],
+        unique=False,
+        postgresql_ops={"username": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_username_pattern", table_name="user")
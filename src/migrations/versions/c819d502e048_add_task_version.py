@@ -0,0 +1,48 @@
+"""add task version
+
+Revision ID: c819d502e048
+Revises: 9d681019777d
+Create Date: 2026-10-18 15:24:51.208364
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c819d502e048"
+down_revision: str | None = "9d681019777d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO task_version (id, version) VALUES (1, 0)")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_task_version() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE task_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER task_version_bump AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON task "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_task_version()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER task_version_bump ON task")
+    op.execute("DROP FUNCTION bump_task_version()")
+    op.drop_table("task_version")
@@ -0,0 +1,40 @@
+"""add partial indexes for task filters
+
+Revision ID: fc6e57e107df
+Revises: a4e53b1ca941
+Create Date: 2026-10-18 10:03:17.542981
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fc6e57e107df"
+down_revision: str | None = "a4e53b1ca941"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_quadrant_id_completed",
+        "task",
+        ["quadrant_id", "completed", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+    op.create_index(
+        "ix_task_completed",
+        "task",
+        ["completed", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_deleted"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_completed", table_name="task", postgresql_where=sa.text("NOT is_deleted"))
+    op.drop_index("ix_task_quadrant_id_completed", table_name="task", postgresql_where=sa.text("NOT is_deleted"))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Email template rendering micro-benchmark.
+
+Usage:
+    python bench_email_templates.py [--iterations N]
+
+This script renders every registered email template (HTML and plain text) repeatedly
+and reports renders per second, so changes to the template registry can be compared.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.email_templates import email_templates
+
+SAMPLE_CONTEXTS = {
+    "magic_link": {
+        "name": "alice",
+        "magic_link": "http://localhost:8000/auth/verify?token=Zr3sC5b0vX1yq2J8h4nW6mK9pT7uE0aD",
+        "otp_code": "123456",
+    },
+    "welcome": {"name": "alice"},
+}
+
+
+def bench(name: str, iterations: int) -> float:
+    context = SAMPLE_CONTEXTS[name]
+    timer = timeit.Timer(lambda: email_templates.render(name, **context))
+    best = min(timer.repeat(repeat=5, number=iterations))
+    return iterations / best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    results = {name: round(bench(name, args.iterations)) for name in SAMPLE_CONTEXTS}
+    print(json.dumps({"renders_per_second": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+End-to-end API load benchmark.
+
+Usage:
+    python bench_load.py [--concurrency N] [--duration SECONDS] [--users N] [--tasks N]
+                         [--seed N] [--output FILE]
+
+This script boots the application from app.main in-process, seeds users, the default
+quadrants and tasks into the configured database, then runs `--concurrency` virtual
+clients for `--duration` seconds. Each client picks operations from a fixed weighted
+mix of the login, task CRUD and listing routes. Results are printed (or written to
+`--output`) as JSON with the overall requests per second and the request count, error
+count and p50/p95/p99 latency of every route.
+
+Requests go through an in-process ASGI transport, so the numbers measure the app and
+the database rather than the network. The application lifespan is not run, so no
+emails are sent; login emails stay queued in the outbox. Point it at a scratch
+database: seeded rows and rows created during the run are left in place. All clients
+share one client address and a handful of emails, so the login rate limiters are
+disabled for the run; otherwise nearly every login would be answered with 429 and the
+login, verify-code and /auth/me path would barely be measured.
+
+It is a benchmark to compare builds on one machine, not a pass/fail check, which is
+why it lives with the other benchmark scripts rather than in the pytest suite.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from sqlalchemy import select
+
+from app.core.db.database import AsyncSession, async_engine, local_session
+from app.core.rate_limit import login_rate_limiters
+from app.crud import tasks as task_crud
+from app.crud.users import create_user_with_available_username
+from app.main import app
+from app.models.auth_token import AuthToken
+from app.models.quadrant import Quadrant
+from app.models.user import User
+from app.schemas.task import TaskCreate
+from app.schemas.user import UserCreate
+from scripts.populate_quadrants import populate_default_quadrants
+
+logging.basicConfig(level=logging.INFO)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+API = "/api/v1"
+
+
+class Results:
+    """Request counts, latency samples and errors keyed by route label."""
+
+    def __init__(self):
+        self.requests: dict[str, int] = defaultdict(int)
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def record(self, route: str, started: float, response: httpx.Response, expected: tuple[int, ...]) -> None:
+        self.requests[route] += 1
+        self.latencies[route].append(time.perf_counter() - started)
+        if response.status_code not in expected:
+            self.errors[route] += 1
+
+    def report(self, elapsed: float) -> dict:
+        routes = {}
+        for route, requests in sorted(self.requests.items()):
+            samples = sorted(self.latencies[route])
+            routes[route] = {
+                "requests": requests,
+                "errors": self.errors[route],
+                "rps": round(requests / elapsed, 2),
+                "p50_ms": percentile(samples, 50),
+                "p95_ms": percentile(samples, 95),
+                "p99_ms": percentile(samples, 99),
+            }
+        total = sum(self.requests.values())
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "rps": round(total / elapsed, 2),
+            "routes": routes,
+        }
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples, in milliseconds."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_samples)))
+    return round(sorted_samples[min(rank, len(sorted_samples)) - 1] * 1000, 3)
+
+
+class VirtualClient:
+    """One simulated API consumer working through the weighted operation mix."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        results: Results,
+        rng: random.Random,
+        emails: list[str],
+        quadrant_ids: list[int],
+        task_ids: list[int],
+    ):
+        self.client = client
+        self.results = results
+        self.rng = rng
+        self.emails = emails
+        self.quadrant_ids = quadrant_ids
+        # Shared between clients so created tasks become targets for everyone
+        self.task_ids = task_ids
+        self.operations: list[tuple[Callable[[], Awaitable[None]], int]] = [
+            (self.list_tasks, 30),
+            (self.list_tasks_filtered, 10),
+            (self.read_task, 20),
+            (self.create_task, 10),
+            (self.update_task, 8),
+            (self.complete_task, 7),
+            (self.delete_task, 3),
+            (self.list_quadrants, 10),
+            (self.login, 2),
+        ]
+
+    async def request(self, route: str, method: str, url: str, expected: tuple[int, ...], **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.results.record(route, started, response, expected)
+        return response
+
+    async def run(self, deadline: float) -> None:
+        operations, weights = zip(*self.operations, strict=True)
+        while time.perf_counter() < deadline:
+            operation = self.rng.choices(operations, weights)[0]
+            await operation()
+
+    async def list_tasks(self) -> None:
+        response = await self.request("GET /tasks/", "GET", f"{API}/tasks/", (200,), params={"limit": 50})
+        cursor = response.json().get("next_cursor") if response.status_code == 200 else None
+        if cursor and self.rng.random() < 0.5:
+            await self.request("GET /tasks/?cursor", "GET", f"{API}/tasks/", (200,), params={"cursor": cursor})
+
+    async def list_tasks_filtered(self) -> None:
+        params = {"quadrant_id": self.rng.choice(self.quadrant_ids), "completed": "false"}
+        await self.request("GET /tasks/?quadrant_id&completed", "GET", f"{API}/tasks/", (200,), params=params)
+
+    async def read_task(self) -> None:
+        task_id = self.rng.choice(self.task_ids)
+        await self.request("GET /tasks/{task_id}", "GET", f"{API}/tasks/{task_id}", (200, 404))
+
+    async def create_task(self) -> None:
+        payload = {"title": f"Load test {uuid.uuid4().hex[:8]}", "quadrant_id": self.rng.choice(self.quadrant_ids)}
+        response = await self.request("POST /tasks/", "POST", f"{API}/tasks/", (201,), json=payload)
+        if response.status_code == 201:
+            self.task_ids.append(response.json()["id"])
+
+    async def update_task(self) -> None:
+        task_id = self.rng.choice(self.task_ids)
+        payload = {"title": f"Updated {uuid.uuid4().hex[:8]}", "quadrant_id": self.rng.choice(self.quadrant_ids)}
+        await self.request("PUT /tasks/{task_id}", "PUT", f"{API}/tasks/{task_id}", (200, 404), json=payload)
+
+    async def complete_task(self) -> None:
+        task_id = self.rng.choice(self.task_ids)
+        url = f"{API}/quadrants/{task_id}/complete"
+        payload = {"completed": self.rng.random() < 0.5}
+        await self.request("PATCH /quadrants/{task_id}/complete", "PATCH", url, (200, 404), json=payload)
+
+    async def delete_task(self) -> None:
+        if len(self.task_ids) <= 1:
+            return
+        task_id = self.task_ids.pop(self.rng.randrange(len(self.task_ids)))
+        await self.request("DELETE /tasks/{task_id}", "DELETE", f"{API}/tasks/{task_id}", (204, 404))
+
+    async def list_quadrants(self) -> None:
+        await self.request("GET /quadrants/", "GET", f"{API}/quadrants/", (200,))
+
+    async def login(self) -> None:
+        email = self.rng.choice(self.emails)
+        response = await self.request(
+            "POST /auth/request-login", "POST", f"{API}/auth/request-login", (204,), json={"email": email}
+        )
+        if response.status_code != 204:
+            return
+        code = await latest_login_code(email)
+        response = await self.request(
+            "POST /auth/verify-code", "POST", f"{API}/auth/verify-code", (200,), json={"email": email, "code": code}
+        )
+        if response.status_code != 200:
+            return
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        await self.request("GET /auth/me", "GET", f"{API}/auth/me", (200,), headers=headers)
+
+
+async def latest_login_code(email: str) -> str:
+    """Read the one-time code the last login request generated, standing in for the user's inbox."""
+    async with local_session() as session:
+        result = await session.execute(
+            select(AuthToken.code)
+            .join(User)
+            .where(User.email == email)
+            .order_by(AuthToken.created_at.desc(), AuthToken.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one()
+
+
+async def seed(session: AsyncSession, run_id: str, users: int, tasks: int) -> tuple[list[str], list[int], list[int]]:
+    """Create the users, quadrants and tasks the run works against."""
+    await populate_default_quadrants(session)
+    result = await session.execute(select(Quadrant.id).order_by(Quadrant.id))
+    quadrant_ids = list(result.scalars().all())
+
+    emails = []
+    for i in range(users):
+        email = f"load-{run_id}-{i}@example.com"
+        name = f"load{run_id}{i}"[:20]
+        await create_user_with_available_username(session, UserCreate(email=email, name=name, username=name))
+        emails.append(email)
+    # User creation only flushes, so the users are committed here
+    await session.commit()
+
+    task_ids = []
+    for start in range(0, tasks, 500):
+        batch = [
+            TaskCreate(title=f"Seed task {i}", quadrant_id=quadrant_ids[i % len(quadrant_ids)], completed=i % 3 == 0)
+            for i in range(start, min(start + 500, tasks))
+        ]
+        task_ids.extend(task.id for task in await task_crud.create_tasks(session, batch))
+
+    return emails, quadrant_ids, task_ids
+
+
+async def run_benchmark(concurrency: int, duration: float, users: int, tasks: int, seed_value: int) -> dict:
+    """Seed the database, drive the app and return the JSON report."""
+    run_id = uuid.uuid4().hex[:6]
+    async with local_session() as session:
+        emails, quadrant_ids, task_ids = await seed(session, run_id, users, tasks)
+    logger.info(f"Seeded {len(emails)} users, {len(quadrant_ids)} quadrants and {len(task_ids)} tasks")
+
+    # A limit of 0 disables a limiter
+    for limiter in login_rate_limiters.values():
+        limiter.limit = 0
+
+    results = Results()
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 12345))
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        clients = [
+            VirtualClient(client, results, random.Random(seed_value + i), emails, quadrant_ids, task_ids)
+            for i in range(concurrency)
+        ]
+        logger.info(f"Running {concurrency} clients for {duration}s")
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(virtual_client.run(deadline) for virtual_client in clients))
+        elapsed = time.perf_counter() - started
+
+    report = results.report(elapsed)
+    report["config"] = {
+        "concurrency": concurrency,
+        "duration_seconds": duration,
+        "users": users,
+        "tasks": tasks,
+        "seed": seed_value,
+    }
+    return report
+
+
+async def main():
+    """Run the load benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the operation mix")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        report = await run_benchmark(args.concurrency, args.duration, args.users, args.tasks, args.seed)
+    finally:
+        await async_engine.dispose()
+    body = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(body + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(body)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
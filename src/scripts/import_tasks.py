@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Bulk task import script.
+
+Usage:
+    python import_tasks.py FILE [--format csv|ndjson]
+
+This script loads tasks from a CSV or NDJSON file into the configured database with
+a single binary COPY, the same way the POST /v1/tasks/import endpoint does. Rows need
+`title` and `quadrant_id`; `description`, `due_date` and `completed` are optional and
+other columns (such as those in a task export) are ignored. The format defaults to the
+file extension. Rows that fail validation are logged and skipped; the script exits
+with a non-zero status if any row was rejected.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.db.database import async_engine, local_session
+from app.core.task_import import import_tasks
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Run the task import."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--format", choices=["csv", "ndjson"], dest="import_format")
+    args = parser.parse_args()
+
+    import_format = args.import_format or args.file.suffix.lstrip(".").lower()
+    if import_format not in ("csv", "ndjson"):
+        parser.error("cannot infer the format from the file extension, pass --format")
+
+    content = args.file.read_text(encoding="utf-8-sig")
+    try:
+        async with local_session() as session:
+            result = await import_tasks(session, content, import_format)
+    except Exception as e:
+        logger.error(f"Error during import: {e}")
+        sys.exit(1)
+    finally:
+        await async_engine.dispose()
+
+    for error in result.errors:
+        logger.warning(f"Row {error.row}: {error.detail}")
+    logger.info(f"Imported {result.imported} tasks, {len(result.errors)} rows rejected")
+    if result.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Expired auth token cleanup script.
+
+Usage:
+    python reap_expired_tokens.py
+
+This script runs a single pass of the expired auth token reaper, for deployments that
+prefer to schedule cleanup externally (e.g. cron) instead of in the application.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.db.database import async_engine
+from app.core.token_reaper import token_reaper
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Run one reaper pass."""
+    try:
+        stats = await token_reaper.run_once()
+        logger.info(f"Deleted {stats['deleted']} expired tokens in {stats['batches']} batches")
+    except Exception as e:
+        logger.error(f"Error during token cleanup: {e}")
+        sys.exit(1)
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture
+def clock(mocker):
+    """Freeze the monotonic clock used by app.core.cache; set `return_value` to move it."""
+    return mocker.patch("app.core.cache.time.monotonic", return_value=1000.0)
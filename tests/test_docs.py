@@ -0,0 +1,14 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_openapi_route_serves_the_cached_schema():
+    client = TestClient(app)
+
+    response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    assert app.openapi_schema is not None
+    assert response.json() == app.openapi_schema
+    assert "/api/v1/tasks/" in response.json()["paths"]
@@ -0,0 +1,100 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import email_dispatcher as dispatcher_module
+from app.core.email_dispatcher import EmailDispatcher
+
+SESSION = object()
+
+
+@pytest.fixture
+def dispatcher(mocker):
+    @asynccontextmanager
+    async def local_session():
+        yield SESSION
+
+    mocker.patch.object(dispatcher_module, "local_session", local_session)
+    return EmailDispatcher(concurrency=2, batch_size=10, poll_interval=1, max_attempts=3, retry_base=30, lease=60)
+
+
+@pytest.fixture
+def sender(mocker):
+    sender = mocker.AsyncMock()
+    mocker.patch.dict(dispatcher_module.EMAIL_SENDERS, {"welcome": sender})
+    return sender
+
+
+@pytest.fixture
+def outbox(mocker):
+    return SimpleNamespace(
+        sent=mocker.patch.object(dispatcher_module, "mark_email_sent"),
+        failed=mocker.patch.object(dispatcher_module, "mark_email_failed"),
+        claim=mocker.patch.object(dispatcher_module, "claim_due_emails"),
+    )
+
+
+def email(attempts: int = 1, email_id: int = 7) -> SimpleNamespace:
+    return SimpleNamespace(id=email_id, kind="welcome", attempts=attempts, payload={"email": "ann@example.com"})
+
+
+def deliver(dispatcher: EmailDispatcher, email) -> None:
+    async def run():
+        dispatcher._semaphore = asyncio.Semaphore(dispatcher.concurrency)
+        await dispatcher._deliver(email)
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(("attempts", "base"), [(1, 30), (2, 60), (3, 120), (20, 3600)])
+def test_retry_delay_backs_off_exponentially_with_jitter(dispatcher, attempts, base):
+    for _ in range(20):
+        delay = dispatcher.retry_delay(attempts).total_seconds()
+        assert base * 0.9 <= delay <= base * 1.1
+
+
+def test_a_sent_email_is_marked_sent(dispatcher, sender, outbox):
+    deliver(dispatcher, email())
+
+    sender.assert_awaited_once_with(email="ann@example.com")
+    outbox.sent.assert_awaited_once_with(SESSION, 7)
+    outbox.failed.assert_not_called()
+
+
+def test_a_failed_email_is_retried_later(mocker, dispatcher, sender, outbox):
+    sender.side_effect = OSError("connection refused")
+    mocker.patch.object(dispatcher, "retry_delay", return_value=timedelta(seconds=60))
+
+    before = datetime.now(UTC)
+    deliver(dispatcher, email(attempts=2))
+
+    outbox.sent.assert_not_called()
+    db, email_id, error, retry_at = outbox.failed.await_args.args
+    assert (db, email_id, error) == (SESSION, 7, "connection refused")
+    assert before + timedelta(seconds=60) <= retry_at <= datetime.now(UTC) + timedelta(seconds=60)
+    dispatcher.retry_delay.assert_called_once_with(2)
+
+
+def test_an_email_is_dead_lettered_after_max_attempts(dispatcher, sender, outbox):
+    sender.side_effect = OSError("connection refused")
+
+    deliver(dispatcher, email(attempts=3))
+
+    outbox.failed.assert_awaited_once_with(SESSION, 7, "connection refused", None)
+    outbox.sent.assert_not_called()
+
+
+def test_dispatch_once_delivers_every_claimed_email(dispatcher, sender, outbox):
+    outbox.claim.return_value = [email(email_id=1), email(email_id=2)]
+    sender.side_effect = [None, OSError("boom")]
+
+    async def run():
+        dispatcher._semaphore = asyncio.Semaphore(dispatcher.concurrency)
+        return await dispatcher.dispatch_once()
+
+    assert asyncio.run(run()) == 2
+    assert outbox.sent.await_count == 1
+    assert outbox.failed.await_count == 1
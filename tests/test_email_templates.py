@@ -0,0 +1,45 @@
+import pytest
+
+from app.core.email_templates import CompiledTemplate, email_templates
+
+
+def test_html_template_escapes_context_values():
+    template = CompiledTemplate("<p>Hi {{ name }}</p>", escape=True, constants={})
+
+    assert template.render(name='<script>alert("x")</script> & co') == (
+        "<p>Hi &lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; co</p>"
+    )
+
+
+def test_html_template_escapes_constants():
+    template = CompiledTemplate('<a href="{{ base_url }}">Open</a>', escape=True, constants={"base_url": '/?a=1&b="2"'})
+
+    assert template.render() == '<a href="/?a=1&amp;b=&quot;2&quot;">Open</a>'
+    assert template.fields == []
+
+
+def test_text_template_does_not_escape():
+    template = CompiledTemplate("Hi {{ name }}, see {{ base_url }}", escape=False, constants={"base_url": "/?a&b"})
+
+    assert template.render(name="<Ann & Bob>") == "Hi <Ann & Bob>, see /?a&b"
+
+
+def test_literal_braces_survive_compilation():
+    template = CompiledTemplate("a { b } {{c}} {{ d }}", escape=False, constants={"d": "{x}"})
+
+    assert template.render(c="{0}") == "a { b } {0} {x}"
+
+
+def test_missing_context_field_raises():
+    template = CompiledTemplate("Hi {{ name }}", escape=True, constants={})
+
+    with pytest.raises(KeyError):
+        template.render()
+
+
+def test_registry_renders_both_parts_escaping_only_html():
+    rendered = email_templates.render("welcome", email="a@example.com", name="<b>Ann</b>")
+
+    assert "&lt;b&gt;Ann&lt;/b&gt;" in rendered.html
+    assert "<b>Ann</b>" not in rendered.html
+    assert "<b>Ann</b>" in rendered.text
@@ -0,0 +1,33 @@
+import pytest
+
+from app.core.etag import etag_matches, make_etag
+
+
+def test_make_etag_is_weak_and_stable():
+    etag = make_etag("limit=50", 7)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert etag == make_etag("limit=50", 7)
+    assert etag != make_etag("limit=50", 8)
+    assert etag != make_etag("limit=20", 7)
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        'W/"abc"',
+        '"abc"',
+        ' W/"abc" ',
+        '"other", W/"abc"',
+        'W/"other",W/"abc"',
+        "*",
+        " * ",
+    ],
+)
+def test_etag_matches(if_none_match):
+    assert etag_matches(if_none_match, 'W/"abc"')
+
+
+@pytest.mark.parametrize("if_none_match", [None, "", 'W/"abcd"', '"ab"', 'W/"other", "x"', "abc"])
+def test_etag_does_not_match(if_none_match):
+    assert not etag_matches(if_none_match, 'W/"abc"')
@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.metrics import Counter, Gauge, Histogram, Metric
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    histogram = Histogram("request_seconds", "Request latency.", ["route"], buckets=(1.0, 0.1))
+    child = histogram.labels("/tasks")
+    for value in (0.05, 0.1, 0.5, 2.0):
+        child.observe(value)
+
+    assert histogram.render() == [
+        "# HELP request_seconds Request latency.",
+        "# TYPE request_seconds histogram",
+        'request_seconds_bucket{route="/tasks",le="0.1"} 2',
+        'request_seconds_bucket{route="/tasks",le="1.0"} 3',
+        'request_seconds_bucket{route="/tasks",le="+Inf"} 4',
+        'request_seconds_sum{route="/tasks"} 2.65',
+        'request_seconds_count{route="/tasks"} 4',
+    ]
+
+
+def test_histogram_without_labels():
+    histogram = Histogram("wait_seconds", "Wait.", buckets=(1.0,))
+    histogram.labels().observe(3.0)
+
+    assert histogram.samples() == [
+        'wait_seconds_bucket{le="1.0"} 0',
+        'wait_seconds_bucket{le="+Inf"} 1',
+        "wait_seconds_sum 3.0",
+        "wait_seconds_count 1",
+    ]
+
+
+def test_label_values_are_escaped():
+    counter = Counter("events_total", "Events.", ["name"])
+    counter.labels('a "quoted"\\ne\nline').inc()
+
+    assert counter.samples() == ['events_total{name="a \\"quoted\\"\\\\ne\\nline"} 1.0']
+
+
+def test_counter_only_increases():
+    counter = Counter("events_total", "Events.")
+    counter.labels().inc(2)
+
+    with pytest.raises(ValueError):
+        counter.labels().inc(-1)
+    assert counter.samples() == ["events_total 2.0"]
+
+
+def test_gauge_can_go_up_down_and_be_set():
+    gauge = Gauge("in_flight", "In flight.", ["method"])
+    gauge.labels("GET").inc()
+    gauge.labels("GET").inc()
+    gauge.labels("GET").dec()
+    gauge.labels("POST").set(5)
+
+    assert gauge.render()[1] == "# TYPE in_flight gauge"
+    assert gauge.samples() == ['in_flight{method="GET"} 1.0', 'in_flight{method="POST"} 5.0']
+
+
+def test_labels_must_match_label_names():
+    counter = Counter("events_total", "Events.", ["method", "route"])
+
+    with pytest.raises(ValueError):
+        counter.labels("GET")
+
+
+def test_metric_is_abstract():
+    with pytest.raises(TypeError):
+        Metric("untyped", "Untyped.")
@@ -0,0 +1,20 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from app.models.quadrant import Quadrant
+from app.models.task import Task
+from app.models.user import User
+
+
+@pytest.mark.parametrize("model", [Task, Quadrant, User])
+def test_inserts_stamp_updated_at_like_created_at(model):
+    # Both come from the application clock, not the second-rounded server default,
+    # so a new row's updated_at is never earlier than its created_at
+    columns = model.__table__.c
+    before = datetime.now(UTC)
+    created_at = columns.created_at.default.arg(None)
+    updated_at = columns.updated_at.default.arg(None)
+
+    assert before <= created_at <= updated_at
+    assert updated_at.tzinfo is not None
@@ -0,0 +1,70 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor, sync_watermark
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=UTC)
+
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_cursor_is_url_safe_and_unpadded():
+    cursor = encode_cursor(datetime(2026, 1, 1, tzinfo=UTC), 10**12)
+
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        "!!!!",
+        # Valid base64, but not JSON
+        "aGVsbG8",
+        # JSON, but not a [timestamp, id] pair
+        "WzFd",
+        "eyJhIjoxfQ",
+        # A pair with an invalid timestamp or id
+        "WyJub3QtYS1kYXRlIiwxXQ",
+        "WyIyMDI2LTAxLTAxVDAwOjAwOjAwIiwiYWJjIl0",
+    ],
+)
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+def test_watermark_lags_behind_now():
+    assert sync_watermark(NOW - timedelta(days=1), NOW, lag=30) == NOW - timedelta(seconds=30)
+
+
+def test_watermark_never_moves_back_past_updated_since():
+    updated_since = NOW - timedelta(seconds=10)
+
+    assert sync_watermark(updated_since, NOW, lag=30) == updated_since
+
+
+def test_watermark_treats_naive_updated_since_as_utc():
+    watermark = sync_watermark(datetime(2026, 10, 18, 11, 59, 50), NOW, lag=30)
+
+    assert watermark == NOW - timedelta(seconds=10)
+    assert watermark.tzinfo is not None
+
+
+def test_watermark_compares_across_time_zones():
+    # 13:59:50 at UTC+2 is ten seconds before NOW
+    updated_since = datetime(2026, 10, 18, 13, 59, 50, tzinfo=timezone(timedelta(hours=2)))
+
+    assert sync_watermark(updated_since, NOW, lag=30) == NOW - timedelta(seconds=10)
+
+
+def test_zero_lag_watermark_is_now():
+    assert sync_watermark(NOW - timedelta(hours=1), NOW, lag=0) == NOW
@@ -0,0 +1,79 @@
+import uuid
+from datetime import UTC, datetime
+
+from app.core.cache import PrincipalCache
+from app.schemas.user import UserInDB
+
+
+def make_principal(user_id: int) -> UserInDB:
+    return UserInDB(
+        id=user_id,
+        uuid=uuid.uuid4(),
+        email=f"user{user_id}@example.com",
+        name=f"User {user_id}",
+        username=f"user{user_id}",
+        profile_image_url="https://example.com/avatar.png",
+        is_superuser=False,
+        tier_id=None,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        updated_at=None,
+        is_deleted=False,
+        deleted_at=None,
+    )
+
+
+def test_get_returns_cached_principal_for_same_token(clock):
+    cache = PrincipalCache(max_size=10, ttl=60)
+    principal = make_principal(1)
+    cache.set(1, "token-a", principal)
+
+    assert cache.get(1, "token-a") is principal
+    assert cache.get(1, "token-b") is None
+    assert cache.stats() == {"size": 1, "max_size": 10, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = PrincipalCache(max_size=10, ttl=60)
+    cache.set(1, "token", make_principal(1))
+
+    clock.return_value = 1059.9
+    assert cache.get(1, "token") is not None
+
+    clock.return_value = 1060.0
+    assert cache.get(1, "token") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = PrincipalCache(max_size=2, ttl=60)
+    cache.set(1, "token", make_principal(1))
+    cache.set(2, "token", make_principal(2))
+    # Touch user 1 so user 2 becomes the least recently used
+    cache.get(1, "token")
+    cache.set(3, "token", make_principal(3))
+
+    assert cache.get(2, "token") is None
+    assert cache.get(1, "token") is not None
+    assert cache.get(3, "token") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate_user_drops_every_token_of_that_user(clock):
+    cache = PrincipalCache(max_size=10, ttl=60)
+    cache.set(1, "token-a", make_principal(1))
+    cache.set(1, "token-b", make_principal(1))
+    cache.set(2, "token-a", make_principal(2))
+
+    cache.invalidate_user(1)
+
+    assert cache.get(1, "token-a") is None
+    assert cache.get(1, "token-b") is None
+    assert cache.get(2, "token-a") is not None
+
+
+def test_zero_max_size_disables_the_cache(clock):
+    cache = PrincipalCache(max_size=0, ttl=60)
+    cache.set(1, "token", make_principal(1))
+
+    assert cache.get(1, "token") is None
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,94 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.crud import quadrants as quadrant_crud
+from app.crud.quadrants import QuadrantCatalog
+
+
+def quadrant(quadrant_id: int, is_default: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=quadrant_id,
+        name=f"Quadrant {quadrant_id}",
+        description=None,
+        color=None,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        is_default=is_default,
+    )
+
+
+@pytest.fixture
+def primary(mocker):
+    primary = mocker.AsyncMock()
+    primary.execute.return_value = mocker.Mock(
+        **{"scalars.return_value.all.return_value": [quadrant(1, True), quadrant(2)]}
+    )
+
+    @asynccontextmanager
+    async def local_session():
+        yield primary
+
+    mocker.patch.object(quadrant_crud, "local_session", local_session)
+    return primary
+
+
+@pytest.fixture
+def db(mocker, primary):
+    """The request's own session, e.g. on a replica."""
+    return mocker.AsyncMock()
+
+
+@pytest.fixture
+def catalog():
+    return QuadrantCatalog(ttl=60)
+
+
+def test_hits_are_served_from_the_snapshot(mocker, primary, db, catalog):
+    by_id = mocker.patch.object(quadrant_crud, "get_quadrant_by_id")
+
+    assert asyncio.run(catalog.get(db, 2)).id == 2
+    assert asyncio.run(catalog.get(db, 1)).is_default
+    assert primary.execute.await_count == 1
+    by_id.assert_not_called()
+
+
+def test_the_snapshot_is_always_loaded_from_the_primary(primary, db, catalog):
+    asyncio.run(catalog.get(db, 1))
+    asyncio.run(catalog.list_json())
+
+    assert primary.execute.await_count == 1
+    db.execute.assert_not_called()
+
+
+def test_a_miss_is_checked_against_the_database(mocker, primary, db, catalog):
+    mocker.patch.object(quadrant_crud, "get_quadrant_by_id", return_value=quadrant(3))
+    asyncio.run(catalog.get(db, 1))
+    version = catalog.version
+
+    assert asyncio.run(catalog.get(db, 3)).id == 3
+    # Found elsewhere, so the snapshot is reloaded on next use
+    assert catalog.version == version + 1
+    asyncio.run(catalog.get(db, 1))
+    assert primary.execute.await_count == 2
+
+
+def test_a_quadrant_missing_from_the_database_does_not_exist(mocker, db, catalog):
+    mocker.patch.object(quadrant_crud, "get_quadrant_by_id", return_value=None)
+    asyncio.run(catalog.get(db, 1))
+    version = catalog.version
+
+    assert asyncio.run(catalog.get(db, 9)) is None
+    assert catalog.version == version
+
+
+def test_existing_ids_only_queries_misses(mocker, db, catalog):
+    db.scalars.return_value = mocker.Mock(**{"all.return_value": [3]})
+
+    assert asyncio.run(catalog.existing_ids(db, {1, 2})) == {1, 2}
+    db.scalars.assert_not_called()
+
+    assert asyncio.run(catalog.existing_ids(db, {2, 3, 4})) == {2, 3}
+    db.scalars.assert_awaited_once()
@@ -0,0 +1,176 @@
+"""Query plan regression tests.
+
+Every task query the API issues is run against the configured database, seeded with
+enough tasks for index plans to pay off, and EXPLAINed with the planner's default
+settings; a sequential scan on an indexed table fails the test. Seeding happens inside a transaction that is always
+rolled back. The tests are skipped when the database cannot be reached, and expect
+it to be migrated to the latest revision.
+
+Queries that read every live task by design (the export stream and the quadrant
+summary) are not checked: a sequential scan is the right plan for them.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.db.database import async_engine
+from app.crud import tasks as task_crud
+from app.schemas.task import TaskUpdate
+
+# Tables whose queries must always be served by an index.
+CHECKED_TABLES = {"task"}
+
+SEED_QUADRANTS = 4
+SEED_TASKS = 20000
+
+_SEED_QUADRANTS_SQL = text(
+    "INSERT INTO quadrant (name, is_default) "
+    "SELECT 'Plan check ' || n, false FROM generate_series(1, :count) AS n RETURNING id"
+)
+# Spread over quadrants and completion states, one task in ten soft deleted, created
+# over two weeks and updated over a month; one in 500 titles contains "needle".
+_SEED_TASKS_SQL = text(
+    """
+    INSERT INTO task (title, quadrant_id, completed, created_at, updated_at, is_deleted, deleted_at)
+    SELECT
+        CASE WHEN n % 500 = 0 THEN 'Find the needle ' ELSE 'Plan check task ' END || n,
+        (CAST(:quadrant_ids AS integer[]))[n % :quadrants + 1],
+        n % 3 = 0,
+        now() - n * interval '1 minute',
+        now() - (n * 7 % 43200) * interval '1 minute',
+        n % 10 = 0,
+        CASE WHEN n % 10 = 0 THEN now() END
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+
+async def _seed(conn: AsyncConnection) -> dict:
+    quadrant_ids = list((await conn.execute(_SEED_QUADRANTS_SQL, {"count": SEED_QUADRANTS})).scalars())
+    await conn.execute(
+        _SEED_TASKS_SQL, {"quadrant_ids": quadrant_ids, "quadrants": len(quadrant_ids), "count": SEED_TASKS}
+    )
+    await conn.execute(text("ANALYZE task"))
+    task_ids = list(
+        (
+            await conn.execute(
+                text("SELECT id FROM task WHERE quadrant_id = :quadrant_id AND NOT is_deleted ORDER BY id LIMIT 4"),
+                {"quadrant_id": quadrant_ids[0]},
+            )
+        ).scalars()
+    )
+    return {"quadrant_id": quadrant_ids[0], "other_quadrant_id": quadrant_ids[1], "task_ids": task_ids}
+
+
+async def _paged(query, session: AsyncSession, **kwargs) -> None:
+    _, cursor = await query(session, **kwargs)
+    await query(session, cursor=cursor, **kwargs)
+
+
+def _hour_ago() -> datetime:
+    return datetime.now(UTC) - timedelta(hours=1)
+
+
+# Mutations come last so the reads see the seeded data unchanged.
+QUERIES = {
+    "tasks page": lambda s, seed: _paged(task_crud.get_tasks_page, s, limit=50),
+    "tasks page by quadrant": lambda s, seed: _paged(
+        task_crud.get_tasks_page, s, limit=50, quadrant_id=seed["quadrant_id"]
+    ),
+    "tasks page by completion": lambda s, seed: _paged(task_crud.get_tasks_page, s, limit=50, completed=True),
+    "tasks page by quadrant and completion": lambda s, seed: _paged(
+        task_crud.get_tasks_page, s, limit=50, quadrant_id=seed["quadrant_id"], completed=False
+    ),
+    "task by id": lambda s, seed: task_crud.get_task_by_id(s, seed["task_ids"][0]),
+    "task changes": lambda s, seed: _paged(task_crud.get_task_changes, s, updated_since=_hour_ago(), limit=5),
+    "search": lambda s, seed: task_crud.search_tasks(s, "needle", limit=20),
+    "search with filters": lambda s, seed: task_crud.search_tasks(
+        s, "needle", limit=20, quadrant_id=seed["quadrant_id"], completed=False
+    ),
+    "update task": lambda s, seed: task_crud.update_task(s, seed["task_ids"][0], TaskUpdate(title="Updated")),
+    "move task": lambda s, seed: task_crud.update_task_quadrant(s, seed["task_ids"][0], seed["other_quadrant_id"]),
+    "complete task": lambda s, seed: task_crud.toggle_task_completion(s, seed["task_ids"][0], True),
+    "delete task": lambda s, seed: task_crud.delete_task(s, seed["task_ids"][0]),
+    "move tasks": lambda s, seed: task_crud.update_tasks_quadrant(s, seed["task_ids"][1:], seed["other_quadrant_id"]),
+    "complete tasks": lambda s, seed: task_crud.set_tasks_completion(s, seed["task_ids"][1:], True),
+    "delete tasks": lambda s, seed: task_crud.delete_tasks(s, seed["task_ids"][1:]),
+}
+
+
+def find_seq_scans(plan: dict) -> list[str]:
+    """Return the checked tables that are sequentially scanned anywhere in the plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in CHECKED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(find_seq_scans(child))
+    return found
+
+
+async def _capture_statements(conn: AsyncConnection, seed: dict) -> dict[str, list[tuple[str, tuple]]]:
+    captured: dict[str, list[tuple[str, tuple]]] = {name: [] for name in QUERIES}
+    current: list[tuple[str, tuple]] = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            current.append((statement, parameters))
+
+    # Commits inside the CRUD functions only release a savepoint of the outer transaction
+    session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+    event.listen(conn.sync_connection, "before_cursor_execute", capture)
+    try:
+        for name, query in QUERIES.items():
+            current = captured[name]
+            await query(session, seed)
+    finally:
+        event.remove(conn.sync_connection, "before_cursor_execute", capture)
+        await session.close()
+    return captured
+
+
+async def _explain_queries() -> dict[str, list[tuple[str, list[str]]]] | None:
+    try:
+        conn = await async_engine.connect()
+    except (OSError, SQLAlchemyError):
+        await async_engine.dispose()
+        return None
+
+    plans: dict[str, list[tuple[str, list[str]]]] = {}
+    try:
+        trans = await conn.begin()
+        try:
+            seed = await _seed(conn)
+            captured = await _capture_statements(conn, seed)
+            for name, statements in captured.items():
+                plans[name] = []
+                for statement, parameters in statements:
+                    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                    plan = result.scalar_one()[0]["Plan"]
+                    plans[name].append((" ".join(statement.split()), find_seq_scans(plan)))
+        finally:
+            await trans.rollback()
+    finally:
+        await conn.close()
+        await async_engine.dispose()
+    return plans
+
+
+@pytest.fixture(scope="module")
+def query_plans() -> dict[str, list[tuple[str, list[str]]]]:
+    plans = asyncio.run(_explain_queries())
+    if plans is None:
+        pytest.skip("Postgres is not available")
+    return plans
+
+
+@pytest.mark.parametrize("query", list(QUERIES))
+def test_query_does_not_seq_scan(query_plans, query):
+    statements = query_plans[query]
+    assert statements, f"{query} issued no statements"
+    for statement, tables in statements:
+        assert not tables, f"Seq Scan on {', '.join(sorted(set(tables)))}: {statement}"
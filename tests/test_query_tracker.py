@@ -0,0 +1,30 @@
+from app.core.query_tracker import RequestQueryStats, statement_shape
+
+
+def test_statement_shape_collapses_placeholders_and_whitespace():
+    statement = "SELECT task.id\n  FROM task\n WHERE task.id = $1 AND task.quadrant_id = $2"
+
+    assert statement_shape(statement) == "SELECT task.id FROM task WHERE task.id = ? AND task.quadrant_id = ?"
+
+
+def test_statement_shape_treats_in_lists_of_any_length_alike():
+    short = "SELECT * FROM task WHERE task.id IN ($1, $2)"
+    long = "SELECT * FROM task WHERE task.id IN ($1,$2,  $3, $4)"
+
+    assert statement_shape(short) == statement_shape(long) == "SELECT * FROM task WHERE task.id IN (?)"
+
+
+def test_statement_shape_keeps_literals_and_identifiers():
+    assert statement_shape("SELECT 1 FROM t10 WHERE a = 'x'") == "SELECT 1 FROM t10 WHERE a = 'x'"
+    assert statement_shape("SELECT 1 FROM a") != statement_shape("SELECT 1 FROM b")
+
+
+def test_request_stats_count_repeated_shapes():
+    stats = RequestQueryStats()
+    for task_id in range(3):
+        stats.record(f"SELECT * FROM task WHERE id = ${task_id + 1}", 0.001)
+    stats.record("SELECT * FROM quadrant", 0.002)
+
+    assert stats.count == 4
+    assert abs(stats.duration - 0.005) < 1e-9
+    assert stats.shapes["SELECT * FROM task WHERE id = ?"] == 3
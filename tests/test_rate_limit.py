@@ -0,0 +1,105 @@
+import ipaddress
+
+import pytest
+from starlette.requests import Request
+
+from app.api import dependencies
+from app.core.rate_limit import TokenBucketLimiter
+
+
+def test_allows_limit_requests_then_waits_for_a_token():
+    limiter = TokenBucketLimiter(limit=3, window=60)
+    for _ in range(3):
+        assert limiter.retry_after("a", now=0.0) == 0
+        limiter.consume("a", now=0.0)
+
+    assert limiter.retry_after("a", now=0.0) == pytest.approx(20.0)
+    assert limiter.retry_after("a", now=15.0) == pytest.approx(5.0)
+    assert limiter.retry_after("a", now=20.0) == 0
+
+
+def test_keys_have_separate_buckets():
+    limiter = TokenBucketLimiter(limit=1, window=10)
+    limiter.consume("a", now=0.0)
+
+    assert limiter.retry_after("a", now=0.0) > 0
+    assert limiter.retry_after("b", now=0.0) == 0
+
+
+def test_tokens_do_not_accumulate_past_the_limit():
+    limiter = TokenBucketLimiter(limit=2, window=10)
+    limiter.consume("a", now=0.0)
+    limiter.consume("a", now=1000.0)
+    limiter.consume("a", now=1000.0)
+
+    assert limiter.retry_after("a", now=1000.0) == pytest.approx(5.0)
+
+
+def test_zero_limit_disables_the_limiter():
+    limiter = TokenBucketLimiter(limit=0, window=60)
+    limiter.consume("a", now=0.0)
+
+    assert limiter.retry_after("a", now=0.0) == 0
+    assert len(limiter) == 0
+
+
+@pytest.mark.parametrize("window", [0, -1])
+def test_window_must_be_positive(window):
+    with pytest.raises(ValueError):
+        TokenBucketLimiter(limit=1, window=window)
+
+
+def test_refilled_buckets_are_swept():
+    limiter = TokenBucketLimiter(limit=1, window=10)
+    limiter.consume("a", now=0.0)
+    limiter.consume("b", now=0.0)
+
+    limiter.consume("c", now=10.0)
+    assert len(limiter) == 1
+
+
+def test_number_of_keys_is_bounded():
+    limiter = TokenBucketLimiter(limit=5, window=10, max_keys=2)
+    for key in ("a", "b", "c"):
+        limiter.consume(key, now=0.0)
+
+    assert len(limiter) == 2
+    assert limiter.retry_after("c", now=0.0) == 0
+    limiter.consume("a", now=0.0)
+    assert len(limiter) == 2
+
+
+def make_request(host: str, forwarded_for: list[str] = ()) -> Request:
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded_for]
+    return Request({"type": "http", "client": (host, 1234), "headers": headers})
+
+
+@pytest.fixture
+def trusted_proxies(mocker):
+    proxies = [ipaddress.ip_network("10.0.0.0/8"), ipaddress.ip_network("::1")]
+    return mocker.patch.object(dependencies, "_trusted_proxies", proxies)
+
+
+@pytest.mark.parametrize(
+    ("host", "forwarded_for", "expected"),
+    [
+        ("203.0.113.5", [], "203.0.113.5"),
+        ("203.0.113.5", ["198.51.100.1"], "203.0.113.5"),
+        ("10.0.0.2", [], "10.0.0.2"),
+        ("10.0.0.2", ["198.51.100.1"], "198.51.100.1"),
+        ("10.0.0.2", ["6.6.6.6, 198.51.100.1"], "198.51.100.1"),
+        ("10.0.0.2", ["198.51.100.1, 10.0.0.3"], "198.51.100.1"),
+        ("10.0.0.2", ["6.6.6.6", "198.51.100.1"], "198.51.100.1"),
+        ("::1", ["2001:db8::1"], "2001:db8::1"),
+        ("10.0.0.2", ["10.0.0.4, 10.0.0.3"], "10.0.0.4"),
+        ("10.0.0.2", ["not-an-ip"], "not-an-ip"),
+        ("10.0.0.2", [" , "], "10.0.0.2"),
+    ],
+)
+def test_client_ip(trusted_proxies, host, forwarded_for, expected):
+    assert dependencies.client_ip(make_request(host, forwarded_for)) == expected
+
+
+def test_client_ip_ignores_forwarded_for_without_trusted_proxies(mocker):
+    mocker.patch.object(dependencies, "_trusted_proxies", [])
+    assert dependencies.client_ip(make_request("10.0.0.2", ["198.51.100.1"])) == "10.0.0.2"
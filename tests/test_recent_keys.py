@@ -0,0 +1,52 @@
+from app.core.cache import RecentKeys
+
+
+def test_keys_expire_after_ttl(clock):
+    keys = RecentKeys(max_size=10, ttl=5)
+    keys.add("a")
+
+    clock.return_value = 1004.9
+    assert "a" in keys
+
+    clock.return_value = 1005.0
+    assert "a" not in keys
+    assert len(keys) == 0
+
+
+def test_adding_again_extends_the_window(clock):
+    keys = RecentKeys(max_size=10, ttl=5)
+    keys.add("a")
+    clock.return_value = 1003.0
+    keys.add("a")
+
+    clock.return_value = 1007.0
+    assert "a" in keys
+
+
+def test_expired_keys_are_dropped_on_access(clock):
+    keys = RecentKeys(max_size=10, ttl=5)
+    keys.add("a")
+    keys.add("b")
+    clock.return_value = 1002.0
+    keys.add("c")
+
+    clock.return_value = 1006.0
+    assert "c" in keys
+    assert len(keys) == 1
+
+
+def test_size_is_bounded(clock):
+    keys = RecentKeys(max_size=2, ttl=5)
+    for key in ("a", "b", "c"):
+        keys.add(key)
+
+    assert len(keys) == 2
+    assert "a" not in keys
+    assert "b" in keys and "c" in keys
+
+
+def test_zero_ttl_disables_tracking(clock):
+    keys = RecentKeys(max_size=10, ttl=0)
+    keys.add("a")
+
+    assert "a" not in keys
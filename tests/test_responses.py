@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from app.core.responses import ClosingStreamingResponse
+
+
+def test_body_is_closed_when_the_client_disconnects():
+    closed = []
+
+    async def body():
+        try:
+            while True:
+                yield b"chunk"
+        finally:
+            closed.append(True)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("connection reset")
+
+    async def respond():
+        response = ClosingStreamingResponse(body())
+        with pytest.raises(ClientDisconnect):
+            await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+        # Checked before asyncio.run finalizes leftover generators on shutdown
+        return list(closed)
+
+    assert asyncio.run(respond()) == [True]
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from app.core.task_events import TaskEventBroker, event_matches_quadrant
+
+MOVED = {"type": "moved", "id": 7, "quadrant_id": 2, "previous_quadrant_id": 1, "completed": False}
+UPDATED = {"type": "updated", "id": 7, "quadrant_id": 1, "completed": False}
+
+
+@pytest.mark.parametrize(
+    ("event", "quadrant_id", "expected"),
+    [
+        (UPDATED, None, True),
+        (UPDATED, 1, True),
+        (UPDATED, 2, False),
+        (MOVED, 2, True),
+        (MOVED, 1, True),
+        (MOVED, 3, False),
+        ({**MOVED, "type": "updated"}, 1, True),
+        ({"type": "deleted", "id": 7, "quadrant_id": 1}, 1, True),
+        ({"type": "resync"}, 1, True),
+        ({"type": "imported", "count": 1000}, 4, True),
+    ],
+)
+def test_event_matches_quadrant(event, quadrant_id, expected):
+    assert event_matches_quadrant(event, quadrant_id) is expected
+
+
+def make_broker(queue_size: int = 10) -> TaskEventBroker:
+    return TaskEventBroker(dsn="postgresql://unused", queue_size=queue_size, retry_interval=1)
+
+
+def drain(queue: asyncio.Queue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_notifications_are_decoded_and_fanned_out():
+    broker = make_broker()
+
+    async def run():
+        async with broker.subscribe() as first, broker.subscribe() as second:
+            broker._on_notification(None, 1, "task_events", '[{"type":"created","id":1},{"type":"created","id":2}]')
+            broker._on_notification(None, 1, "task_events", "not json")
+            return drain(first), drain(second)
+
+    first, second = asyncio.run(run())
+    assert [event["id"] for event in first] == [1, 2]
+    assert second == first
+    assert broker.subscriber_count == 0
+
+
+def test_subscribers_that_fall_behind_are_disconnected():
+    broker = make_broker(queue_size=2)
+
+    async def run():
+        async with broker.subscribe() as queue:
+            broker._broadcast([{"type": "created", "id": n} for n in range(3)])
+            return drain(queue), broker.subscriber_count
+
+    events, subscribers = asyncio.run(run())
+    assert events == [{"type": "created", "id": 0}, {"type": "created", "id": 1}, None]
+    assert subscribers == 0
@@ -0,0 +1,68 @@
+from app.core.task_import import parse_task_rows
+
+
+def test_csv_rows_are_numbered_after_the_header():
+    content = "title,description,quadrant_id,completed\nWrite report,,1,true\nCall Bob,Re: invoice,2,\n"
+
+    rows, errors = parse_task_rows(content, "csv")
+
+    assert errors == []
+    assert [row_number for row_number, _ in rows] == [1, 2]
+    first, second = (task for _, task in rows)
+    assert (first.title, first.description, first.quadrant_id, first.completed) == ("Write report", None, 1, True)
+    assert (second.description, second.completed) == ("Re: invoice", False)
+
+
+def test_csv_quoted_fields():
+    rows, errors = parse_task_rows('title,quadrant_id\n"Plan, then ""ship""",3\n', "csv")
+
+    assert errors == []
+    assert rows[0][1].title == 'Plan, then "ship"'
+
+
+def test_csv_invalid_rows_are_reported_and_skipped():
+    content = "title,quadrant_id\nok,1\n,2\nbad quadrant,x\n"
+
+    rows, errors = parse_task_rows(content, "csv")
+
+    assert [row_number for row_number, _ in rows] == [1]
+    assert [error.row for error in errors] == [2, 3]
+    assert errors[0].detail.startswith("title: ")
+    assert errors[1].detail.startswith("quadrant_id: ")
+
+
+def test_ndjson_rows_are_numbered_by_line():
+    content = '{"title": "a", "quadrant_id": 1}\n\n{"title": "b", "quadrant_id": 4, "completed": true}\n'
+
+    rows, errors = parse_task_rows(content, "ndjson")
+
+    assert errors == []
+    assert [(row_number, task.title) for row_number, task in rows] == [(1, "a"), (3, "b")]
+    assert rows[1][1].completed is True
+
+
+def test_ndjson_malformed_lines():
+    content = '{"title": "a", "quadrant_id": 1}\n{not json\n[1, 2]\n{"quadrant_id": 1}\n'
+
+    rows, errors = parse_task_rows(content, "ndjson")
+
+    assert [row_number for row_number, _ in rows] == [1]
+    assert [error.row for error in errors] == [2, 3, 4]
+    assert errors[0].detail.startswith("Invalid JSON: ")
+    assert errors[1].detail == "Expected a JSON object"
+    assert errors[2].detail == "title: Field required"
+
+
+def test_multiple_validation_errors_are_joined():
+    _, errors = parse_task_rows('{"title": "", "quadrant_id": "x"}\n', "ndjson")
+
+    assert len(errors) == 1
+    assert "; " in errors[0].detail
+    assert errors[0].detail.startswith("title: ")
+    assert "quadrant_id: " in errors[0].detail
+
+
+def test_empty_input():
+    assert parse_task_rows("", "csv") == ([], [])
+    assert parse_task_rows("title,quadrant_id\n", "csv") == ([], [])
+    assert parse_task_rows("\n\n", "ndjson") == ([], [])
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.crud import users as user_crud
+from app.schemas.user import UserCreate
+
+
+class UniqueViolation(Exception):
+    def __init__(self, constraint_name: str):
+        super().__init__(f"duplicate key value violates unique constraint {constraint_name}")
+        self.constraint_name = constraint_name
+
+
+def unique_violation(constraint_name: str) -> IntegrityError:
+    # Shaped like SQLAlchemy's wrapping of an asyncpg UniqueViolationError
+    orig = Exception("duplicate key")
+    orig.__cause__ = UniqueViolation(constraint_name)
+    return IntegrityError('INSERT INTO "user"', {}, orig)
+
+
+@pytest.fixture
+def db(mocker):
+    db = mocker.AsyncMock()
+    db.add = mocker.Mock()
+    db.begin_nested = mocker.MagicMock()
+    db.begin_nested.return_value.__aexit__.return_value = False
+    return db
+
+
+@pytest.fixture
+def user_create():
+    return UserCreate(email="ann@example.com", name="ann", username="ann")
+
+
+@pytest.fixture
+def available_username(mocker):
+    return mocker.patch.object(user_crud, "get_available_username", side_effect=["ann", "ann1", "ann2"])
+
+
+def test_retries_when_the_username_is_taken_concurrently(mocker, db, user_create, available_username):
+    user = object()
+    create_user = mocker.patch.object(
+        user_crud, "create_user", side_effect=[unique_violation(user_crud.USERNAME_CONSTRAINT), user]
+    )
+
+    assert asyncio.run(user_crud.create_user_with_available_username(db, user_create)) is user
+    assert [call.args[1].username for call in create_user.await_args_list] == ["ann", "ann1"]
+    # Each attempt runs in its own savepoint; the outer transaction is left alone
+    assert db.begin_nested.call_count == 2
+    db.rollback.assert_not_called()
+    db.commit.assert_not_called()
+
+
+def test_other_integrity_errors_are_not_retried(mocker, db, user_create, available_username):
+    create_user = mocker.patch.object(user_crud, "create_user", side_effect=unique_violation("ix_user_email"))
+
+    with pytest.raises(IntegrityError):
+        asyncio.run(user_crud.create_user_with_available_username(db, user_create))
+    assert create_user.await_count == 1
+
+
+def test_gives_up_after_the_last_attempt(mocker, db, user_create, available_username):
+    create_user = mocker.patch.object(
+        user_crud, "create_user", side_effect=unique_violation(user_crud.USERNAME_CONSTRAINT)
+    )
+
+    with pytest.raises(IntegrityError):
+        asyncio.run(user_crud.create_user_with_available_username(db, user_create, attempts=2))
+    assert create_user.await_count == 2
+
+
+def test_raises_without_attempts(mocker, db, user_create, available_username):
+    create_user = mocker.patch.object(user_crud, "create_user")
+
+    with pytest.raises(ValueError):
+        asyncio.run(user_crud.create_user_with_available_username(db, user_create, attempts=0))
+    create_user.assert_not_called()
+
+
+def test_create_user_flushes_without_committing(db, user_create):
+    asyncio.run(user_crud.create_user(db, user_create))
+
+    db.add.assert_called_once()
+    db.flush.assert_awaited_once()
+    db.commit.assert_not_called()
@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.core import warmup
+
+
+@pytest.fixture
+def sessions(mocker):
+    opened = []
+
+    def factory(name):
+        @asynccontextmanager
+        async def session():
+            opened.append(name)
+            yield name
+
+        return session
+
+    mocker.patch.object(warmup, "local_session", factory("primary"))
+    mocker.patch.object(warmup, "read_session", factory("replica"))
+    return opened
+
+
+@pytest.fixture
+def queries(mocker):
+    mocker.patch.object(warmup.quadrant_crud, "get_quadrants_json")
+    return {
+        "version": mocker.patch.object(warmup.task_crud, "get_tasks_version"),
+        "page": mocker.patch.object(warmup.task_crud, "get_tasks_page"),
+    }
+
+
+def test_primes_only_the_primary_without_a_replica(mocker, sessions, queries):
+    mocker.patch.object(warmup, "replica_engine", None)
+
+    asyncio.run(warmup.prime_queries())
+
+    assert sessions == ["primary"]
+    assert [call.args[0] for call in queries["page"].await_args_list] == ["primary"]
+
+
+def test_primes_the_read_session_with_a_replica(mocker, sessions, queries):
+    mocker.patch.object(warmup, "replica_engine", object())
+
+    asyncio.run(warmup.prime_queries())
+
+    assert sessions == ["primary", "replica"]
+    for query in queries.values():
+        assert [call.args[0] for call in query.await_args_list] == ["primary", "replica"]